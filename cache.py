@@ -0,0 +1,199 @@
+import os
+import re
+import time
+import hashlib
+import tempfile
+import logging
+import threading
+import orjson
+import pandas as pd
+from datetime import datetime
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+from config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Format of the entries FileCache writes; entries of any other version are treated as misses
+ENTRY_VERSION = 2
+
+def _encode(value: Any) -> Any:
+    """Tag the values JSON can't carry (timestamps, datetimes, NaN, tuples) so they survive the round trip"""
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode(item) for item in value]}
+    if isinstance(value, float) and value != value:
+        # orjson writes NaN as null
+        return {'__nan__': True}
+    if isinstance(value, pd.Timestamp) or value is pd.NaT:
+        return {'__timestamp__': value.isoformat()}
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    return value
+
+def _decode(value: Any) -> Any:
+    """Reverse _encode, so a cache hit returns the same types as the original fetch"""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        tag, item = next(iter(value.items()))
+        if tag == '__tuple__':
+            return tuple(_decode(element) for element in item)
+        if tag == '__nan__':
+            return float('nan')
+        if tag == '__timestamp__':
+            return pd.Timestamp(item)
+        if tag == '__datetime__':
+            return datetime.fromisoformat(item)
+    return {key: _decode(item) for key, item in value.items()}
+
+class FileCache:
+    """Persistent on-disk cache with per-entry TTL"""
+    
+    def __init__(self, cache_dir: str = CONFIG.CACHE_DIR):
+        self.cache_dir = cache_dir
+    
+    def _path(self, symbol: str, endpoint: str, key: str) -> str:
+        """Build the cache file path, keeping symbols from escaping the cache directory"""
+        safe_symbol = re.sub(r'[^\w^=.-]', '_', symbol).lstrip('.') or '_'
+        return os.path.join(self.cache_dir, safe_symbol, f"{endpoint}_{key}.json")
+    
+    def get(self, symbol: str, endpoint: str, key: str, ttl: float) -> Optional[Any]:
+        """Return the cached value, or None if it is missing or older than ttl seconds"""
+        path = self._path(symbol, endpoint, key)
+        
+        try:
+            with open(path, 'rb') as f:
+                entry = orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        if entry.get('version') != ENTRY_VERSION or entry.get('ts', 0) + ttl < time.time():
+            return None
+        
+        return _decode(entry.get('data'))
+    
+    def set(self, symbol: str, endpoint: str, key: str, data: Any) -> None:
+        """Store a value with the current timestamp"""
+        path = self._path(symbol, endpoint, key)
+        
+        try:
+            # numpy scalars/arrays encode natively; anything else untagged falls back to str
+            payload = orjson.dumps(
+                {'version': ENTRY_VERSION, 'ts': time.time(), 'data': _encode(data)},
+                default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Skipping cache write for {symbol}/{endpoint}: {str(e)}")
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            
+        except OSError as e:
+            logger.warning(f"Error writing cache entry for {symbol}/{endpoint}: {str(e)}")
+
+file_cache = FileCache()
+
+class MemoryCache:
+    """Bounded in-process store with a monotonic expiry per entry"""
+    
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the stored value, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+    
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds"""
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                # Evict expired entries first, then the oldest insertion
+                for stale in [k for k, (expiry, _) in self._entries.items() if expiry <= now]:
+                    del self._entries[stale]
+                if len(self._entries) >= self.maxsize:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + ttl, value)
+
+def _call_key(args: tuple, kwargs: Dict[str, Any]) -> tuple:
+    """Key a call by its arguments; underscore-prefixed kwargs are call context (e.g. _now), not part of the key"""
+    return args, tuple(sorted((k, v) for k, v in kwargs.items() if not k.startswith('_')))
+
+def _is_empty(value: Any) -> bool:
+    """Treat empty DataFrames and empty containers alike as failed fetches"""
+    empty = getattr(value, 'empty', None)
+    return empty if isinstance(empty, bool) else not value
+
+def cached(endpoint: str, ttl: float) -> Callable:
+    """Cache a fetcher method's result on disk, keyed by symbol and the remaining arguments"""
+    def decorator(func: Callable) -> Callable:
+        # Hot entries are also held in process briefly, which skips the disk read and parse
+        memory = MemoryCache()
+        memory_ttl = min(ttl, CONFIG.MEMORY_CACHE_TTL)
+        
+        @wraps(func)
+        def wrapper(self, symbol: str, *args, **kwargs):
+            # Hashed via repr, so unhashable arguments (e.g. a list of fields) still make a key
+            key = hashlib.md5(repr(_call_key(args, kwargs)).encode()).hexdigest()
+            
+            value = memory.get((symbol, key))
+            if value is not None:
+                return value
+            
+            value = file_cache.get(symbol, endpoint, key, ttl)
+            if value is None:
+                value = func(self, symbol, *args, **kwargs)
+                
+                # Empty results mean the fetch failed; don't cache them
+                if not value:
+                    return value
+                file_cache.set(symbol, endpoint, key, value)
+            
+            memory.set((symbol, key), value, memory_ttl)
+            return value
+        return wrapper
+    return decorator
+
+def ttl_cache(ttl: float, maxsize: int = 2048) -> Callable:
+    """Memoize a function or method in process for ttl seconds, keyed by its arguments"""
+    def decorator(func: Callable) -> Callable:
+        memory = MemoryCache(maxsize)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _call_key(args, kwargs)
+            
+            value = memory.get(key)
+            if value is not None:
+                return value
+            
+            value = func(*args, **kwargs)
+            
+            # Empty results mean the fetch failed; don't cache them
+            if not _is_empty(value):
+                memory.set(key, value, ttl)
+            
+            return value
+        return wrapper
+    return decorator
@@ -1,40 +1,66 @@
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 load_dotenv()
 
+@dataclass(frozen=True)
 class Config:
+    """Application settings; read through the shared CONFIG instance"""
+    
     # API Keys
-    ALPHA_VANTAGE_API_KEY = os.getenv('ALPHA_VANTAGE_API_KEY', '')
-    FINNHUB_API_KEY = os.getenv('FINNHUB_API_KEY', '')
+    ALPHA_VANTAGE_API_KEY: str = os.getenv('ALPHA_VANTAGE_API_KEY', '')
+    FINNHUB_API_KEY: str = os.getenv('FINNHUB_API_KEY', '')
     
     # Database
-    DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./stock_advisor.db')
+    DATABASE_URL: str = os.getenv('DATABASE_URL', 'sqlite:///./stock_advisor.db')
+    DB_POOL_SIZE: int = 20  # Persistent connections kept by the engine pool
+    DB_MAX_OVERFLOW: int = 40  # Extra connections opened under burst load
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
     
     # Application settings
-    DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
-    SECRET_KEY = os.getenv('SECRET_KEY', 'your-secret-key-here')
+    DEBUG: bool = os.getenv('DEBUG', 'False').lower() == 'true'
+    SECRET_KEY: str = os.getenv('SECRET_KEY', 'your-secret-key-here')
     
     # Data settings
-    DEFAULT_TIMEFRAME = '1d'
-    DEFAULT_PERIOD = '1y'
-    MAX_STOCKS_PER_PORTFOLIO = 100
+    DEFAULT_TIMEFRAME: str = '1d'
+    DEFAULT_PERIOD: str = '1y'
+    MAX_STOCKS_PER_PORTFOLIO: int = 100
+    MAX_CONCURRENT_REQUESTS: int = 64  # Symbols fetched in parallel by batch_fetch_data
+    MAX_MARKET_DATA_WORKERS: int = 10  # Threads for sector ETF and index lookups
+    MARKET_REFRESH_INTERVAL: int = 30  # Seconds between background market overview refreshes
+    THREADPOOL_SIZE: int = 64  # Worker threads for sync API endpoints and offloaded fetches
+    HTTP_POOL_SIZE: int = 64  # Pooled connections per host on the fetcher session
+    MAX_RETRIES: int = 3  # Attempts per yfinance call on transient network errors
+    RETRY_BACKOFF: int = 1  # Seconds before the first retry; doubles on each attempt
+    
+    # Cache settings (TTLs in seconds)
+    CACHE_DIR: str = os.getenv('CACHE_DIR', '.cache')
+    FUNDAMENTAL_CACHE_TTL: int = 86400  # 1 day
+    STATEMENT_CACHE_TTL: int = 604800  # 7 days - statements only change quarterly
+    NEWS_CACHE_TTL: int = 900  # 15 minutes
+    PRICE_CACHE_TTL: int = 60  # In-process reuse of fetched price frames
+    TICKER_CACHE_TTL: int = 900  # How long a shared yf.Ticker (and its memoized .info) is reused
+    MEMORY_CACHE_TTL: int = 60  # In-process reuse of disk-cached results and computed analyses
+    INDICATOR_CACHE_TTL: int = 3600  # Indicators keyed by latest bar; the TTL only bounds memory
     
     # Technical analysis settings
-    RSI_PERIOD = 14
-    MACD_FAST = 12
-    MACD_SLOW = 26
-    MACD_SIGNAL = 9
-    BOLLINGER_PERIOD = 20
-    BOLLINGER_STD = 2
+    RSI_PERIOD: int = 14
+    MACD_FAST: int = 12
+    MACD_SLOW: int = 26
+    MACD_SIGNAL: int = 9
+    BOLLINGER_PERIOD: int = 20
+    BOLLINGER_STD: int = 2
+    INDICATOR_WORKERS: int = os.cpu_count() or 4  # Threads for TechnicalAnalyzer.calculate_many
     
     # Fundamental analysis settings
-    MIN_MARKET_CAP = 1000000000  # $1B
-    MAX_PE_RATIO = 100
-    MIN_VOLUME = 1000000  # 1M shares
+    MIN_MARKET_CAP: int = 1000000000  # $1B
+    MAX_PE_RATIO: int = 100
+    MIN_VOLUME: int = 1000000  # 1M shares
     
     # ML model settings
-    PREDICTION_DAYS = 30
-    CONFIDENCE_THRESHOLD = 0.7
-    MODEL_UPDATE_FREQUENCY = '1d'  # Update models daily
+    PREDICTION_DAYS: int = 30
+    CONFIDENCE_THRESHOLD: float = 0.7
+    MODEL_UPDATE_FREQUENCY: str = '1d'  # Update models daily
 
+CONFIG = Config()
@@ -2,106 +2,321 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from config import Config
+from urllib.parse import quote
+from typing import Callable, Dict, List, Optional, Tuple
+from config import CONFIG
+from cache import cached, ttl_cache, MemoryCache
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+CHART_URL = 'https://query1.finance.yahoo.com/v8/finance/chart/{symbol}'
+
+# Sector ETFs used for sector performance comparison
+SECTOR_ETFS = MappingProxyType({
+    'XLK': 'Technology',
+    'XLF': 'Financials',
+    'XLE': 'Energy',
+    'XLV': 'Healthcare',
+    'XLI': 'Industrials',
+    'XLP': 'Consumer Staples',
+    'XLY': 'Consumer Discretionary',
+    'XLB': 'Materials',
+    'XLU': 'Utilities',
+    'XLRE': 'Real Estate'
+})
+
+# Major market indices
+INDICES = MappingProxyType({
+    '^GSPC': 'S&P 500',
+    '^DJI': 'Dow Jones',
+    '^IXIC': 'NASDAQ',
+    '^VIX': 'VIX Volatility'
+})
+
+# Output key -> yfinance news item key
+NEWS_FIELDS = (
+    ('title', 'title'),
+    ('summary', 'summary'),
+    ('link', 'link'),
+    ('publisher', 'publisher'),
+    ('published', 'providerPublishTime')
+)
+
+# (output key, yfinance info key, default)
+FUNDAMENTAL_FIELDS = (
+    ('company_name', 'longName', ''),
+    ('sector', 'sector', ''),
+    ('industry', 'industry', ''),
+    ('market_cap', 'marketCap', 0),
+    ('pe_ratio', 'trailingPE', 0),
+    ('pb_ratio', 'priceToBook', 0),
+    ('dividend_yield', 'dividendYield', 0),
+    ('beta', 'beta', 0),
+    ('roe', 'returnOnEquity', 0),
+    ('roa', 'returnOnAssets', 0),
+    ('debt_to_equity', 'debtToEquity', 0),
+    ('current_ratio', 'currentRatio', 0),
+    ('quick_ratio', 'quickRatio', 0),
+    ('gross_margin', 'grossMargins', 0),
+    ('operating_margin', 'operatingMargins', 0),
+    ('net_margin', 'netIncomeToCommon', 0),
+    ('revenue_growth', 'revenueGrowth', 0),
+    ('earnings_growth', 'earningsGrowth', 0),
+    ('book_value', 'bookValue', 0),
+    ('cash_per_share', 'totalCashPerShare', 0),
+    ('revenue_per_share', 'revenuePerShare', 0),
+    ('earnings_per_share', 'trailingEps', 0),
+    ('forward_pe', 'forwardPE', 0),
+    ('peg_ratio', 'pegRatio', 0),
+    ('price_to_sales', 'priceToSalesTrailing12Months', 0),
+    ('enterprise_value', 'enterpriseValue', 0),
+    ('enterprise_to_revenue', 'enterpriseToRevenue', 0),
+    ('enterprise_to_ebitda', 'enterpriseToEbitda', 0),
+    ('shares_outstanding', 'sharesOutstanding', 0),
+    ('float_shares', 'floatShares', 0),
+    ('insider_ownership', 'heldPercentInsiders', 0),
+    ('institutional_ownership', 'heldPercentInstitutions', 0),
+    ('short_ratio', 'shortRatio', 0),
+    ('short_percent_of_float', 'shortPercentOfFloat', 0),
+    ('fifty_two_week_high', 'fiftyTwoWeekHigh', 0),
+    ('fifty_two_week_low', 'fiftyTwoWeekLow', 0),
+    ('fifty_day_average', 'fiftyDayAverage', 0),
+    ('two_hundred_day_average', 'twoHundredDayAverage', 0),
+    ('volume', 'volume', 0),
+    ('avg_volume', 'averageVolume', 0)
+)
+
+# Fields that ticker.fast_info can serve without the full quoteSummary request
+FAST_INFO_FIELDS = {
+    'market_cap': 'marketCap',
+    'shares_outstanding': 'shares',
+    'fifty_two_week_high': 'yearHigh',
+    'fifty_two_week_low': 'yearLow',
+    'fifty_day_average': 'fiftyDayAverage',
+    'two_hundred_day_average': 'twoHundredDayAverage',
+    'volume': 'lastVolume',
+    'avg_volume': 'threeMonthAverageVolume'
+}
+
 class StockDataFetcher:
     """Fetches stock data from multiple sources"""
     
     def __init__(self):
-        self.alpha_vantage_key = Config.ALPHA_VANTAGE_API_KEY
+        self.alpha_vantage_key = CONFIG.ALPHA_VANTAGE_API_KEY
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': 'StockAdvisor/1.0'})
+        
+        # The default pool holds 10 connections per host, which serializes threaded fetches
+        adapter = HTTPAdapter(
+            pool_connections=CONFIG.HTTP_POOL_SIZE,
+            pool_maxsize=CONFIG.HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Shared yf.Ticker per symbol, replaced once it expires
+        self._tickers = MemoryCache(maxsize=1024)
+    
+    def _ticker(self, symbol: str) -> yf.Ticker:
+        """Return a shared yf.Ticker for the symbol so its cookie/crumb handshake is reused"""
+        ticker = self._tickers.get(symbol)
+        if ticker is None:
+            # yf.Ticker memoizes .info internally, so each instance is only kept for TICKER_CACHE_TTL seconds
+            ticker = yf.Ticker(symbol, session=self.session)
+            self._tickers.set(symbol, ticker, CONFIG.TICKER_CACHE_TTL)
+        return ticker
     
-    def get_stock_data(self, symbol: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
-        """Fetch stock data using yfinance"""
-        max_retries = 3
-        retry_delay = 1
+    def _optimize_price_frame(self, data: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        """Move the date index into a column and downcast OHLCV to compact dtypes"""
+        # Reset index to make date a column
+        data = data.reset_index()
         
-        for attempt in range(max_retries):
+        # Prices fit comfortably in float32; volume takes the smallest integer type that holds it
+        for col in ['Open', 'High', 'Low', 'Close', 'Adj Close']:
+            if col in data.columns:
+                data[col] = pd.to_numeric(data[col], downcast='float')
+        if 'Volume' in data.columns:
+            data['Volume'] = pd.to_numeric(data['Volume'], downcast='integer')
+        
+        # Symbol is constant per frame, so store it once as a category
+        data['Symbol'] = pd.Series(symbol, index=data.index, dtype='category')
+        
+        return data
+    
+    def _serialize_frame(self, df: pd.DataFrame) -> Dict:
+        """Convert a frame to 'split' form: index labels, column labels and row values"""
+        # One list per row instead of one dict per row; statement line items live in the index
+        return df.to_dict('split')
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """Whether an error is a transient network failure worth retrying"""
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        if isinstance(error, requests.exceptions.HTTPError):
+            # Rate limiting and server errors are transient; 4xx client errors are not
+            status = error.response.status_code if error.response is not None else None
+            return status is None or status == 429 or status >= 500
+        return False
+    
+    def _with_retries(self, fn: Callable, *args, **kwargs):
+        """Call fn, retrying transient network errors with exponential backoff"""
+        for attempt in range(CONFIG.MAX_RETRIES):
             try:
-                ticker = yf.Ticker(symbol)
-                data = ticker.history(period=period, interval=interval)
+                return fn(*args, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if not self._is_retryable(e) or attempt == CONFIG.MAX_RETRIES - 1:
+                    raise
                 
-                if data.empty:
-                    logger.warning(f"No data found for {symbol}")
-                    return pd.DataFrame()
-                
-                # Reset index to make date a column
-                data.reset_index(inplace=True)
-                data['Symbol'] = symbol
-                
-                return data
-                
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"Network error fetching {symbol} (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-                else:
-                    logger.error(f"Failed to fetch {symbol} after {max_retries} attempts: {str(e)}")
-                    return pd.DataFrame()
-            except Exception as e:
-                logger.error(f"Error fetching data for {symbol}: {str(e)}")
-                return pd.DataFrame()
+                delay = CONFIG.RETRY_BACKOFF * (2 ** attempt)
+                logger.warning(f"Network error (attempt {attempt + 1}/{CONFIG.MAX_RETRIES}), retrying in {delay}s: {str(e)}")
+                time.sleep(delay)
     
-    def get_fundamental_data(self, symbol: str) -> Dict:
-        """Fetch fundamental data for a stock"""
+    def _chart(self, symbol: str, range_: str, interval: str) -> pd.DataFrame:
+        """Fetch adjusted OHLCV straight from Yahoo's v8 chart endpoint"""
+        response = self.session.get(
+            CHART_URL.format(symbol=quote(symbol)),
+            params={'range': range_, 'interval': interval, 'events': 'div,splits'},
+            timeout=10
+        )
+        response.raise_for_status()
+        
+        results = orjson.loads(response.content)['chart']['result']
+        if not results or not results[0].get('timestamp'):
+            return pd.DataFrame()
+        
+        result = results[0]
+        indicators = result['indicators']
+        prices = indicators['quote'][0]
+        
+        # Match yfinance: index in the exchange's timezone, missing bars as NaN
+        index = pd.DatetimeIndex(np.array(result['timestamp'], dtype='datetime64[s]'), name='Date')
+        timezone = result.get('meta', {}).get('exchangeTimezoneName')
+        if timezone:
+            index = index.tz_localize('UTC').tz_convert(timezone)
+        
+        # Apply split/dividend adjustment like ticker.history(auto_adjust=True)
+        close = np.asarray(prices['close'], dtype=np.float64)
+        adjclose = indicators.get('adjclose')
+        ratio = np.asarray(adjclose[0]['adjclose'], dtype=np.float64) / close if adjclose else 1.0
+        
+        # Build every column once in its final dtype so no float64 frame is ever materialized
+        columns = {
+            col: (np.asarray(prices[key], dtype=np.float64) * ratio).astype(np.float32)
+            for col, key in (('Open', 'open'), ('High', 'high'), ('Low', 'low'), ('Close', 'close'))
+        }
+        volume = np.asarray(prices['volume'], dtype=np.float64)
+        columns['Volume'] = volume if np.isnan(volume).any() else volume.astype(np.int64)
+        
+        # Corporate actions on the bar they fall in, zero elsewhere, as in ticker.history's Dividends/Stock Splits
+        events = result.get('events', {})
+        timestamps = np.asarray(result['timestamp'], dtype=np.int64)
+        columns['Dividends'] = self._event_column(timestamps, events.get('dividends', {}), lambda e: e['amount'])
+        columns['Stock Splits'] = self._event_column(
+            timestamps, events.get('splits', {}), lambda e: e['numerator'] / e['denominator']
+        )
+        
+        data = pd.DataFrame(columns, index=index, copy=False)
+        
+        # Yahoo pads halted sessions with null bars; drop them without copying when there are none
+        empty_rows = np.isnan(close) & np.isnan(volume)
+        return data[~empty_rows] if empty_rows.any() else data
+    
+    def _event_column(self, timestamps: np.ndarray, events: Dict, value: Callable) -> np.ndarray:
+        """Place chart events (keyed by epoch seconds) on the bar whose interval contains them"""
+        column = np.zeros(len(timestamps))
+        for event in events.values():
+            position = np.searchsorted(timestamps, event['date'], side='right') - 1
+            if position >= 0:
+                column[position] += value(event)
+        return column
+    
+    def _to_backend(self, data: pd.DataFrame, backend: str):
+        """Convert a price frame to the requested dataframe library"""
+        if backend == 'pandas':
+            return data
+        if backend == 'polars':
+            # Optional dependency, only imported by callers that ask for it
+            import polars as pl
+            return pl.from_pandas(data)
+        raise ValueError(f"Unsupported dataframe backend: {backend}")
+    
+    @ttl_cache(ttl=CONFIG.PRICE_CACHE_TTL)
+    def _fetch_price_frame(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
+        """Fetch and optimize a price frame; memoized briefly and shared across callers"""
         try:
-            ticker = yf.Ticker(symbol)
+            try:
+                data = self._with_retries(self._chart, symbol, period, interval)
+            except (requests.exceptions.RequestException, KeyError, IndexError, TypeError, ValueError) as e:
+                # Yahoo sometimes rejects bare API clients; yfinance handles the cookie/crumb dance
+                logger.warning(f"Chart endpoint failed for {symbol}, falling back to yfinance: {str(e)}")
+                ticker = self._ticker(symbol)
+                data = self._with_retries(ticker.history, period=period, interval=interval)
+            
+            if data.empty:
+                logger.warning(f"No data found for {symbol}")
+                return pd.DataFrame()
             
-            # Get basic info
-            info = ticker.info
+            return self._optimize_price_frame(data, symbol)
+            
+        except Exception as e:
+            logger.error(f"Error fetching data for {symbol}: {str(e)}")
+            return pd.DataFrame()
+    
+    def get_stock_data(self, symbol: str, period: str = "1y", interval: str = "1d", backend: str = "pandas"):
+        """Fetch stock data using yfinance, as a pandas or polars DataFrame"""
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"Unsupported dataframe backend: {backend}")
+        
+        # Callers add indicator columns in place, so never hand out the cached frame itself
+        data = self._fetch_price_frame(symbol, period, interval).copy()
+        
+        return self._to_backend(data, backend)
+    
+    @cached('fundamental', ttl=CONFIG.FUNDAMENTAL_CACHE_TTL)
+    def get_fundamental_data(self, symbol: str, fields: Optional[List[str]] = None, _now: Optional[datetime] = None) -> Dict:
+        """Fetch fundamental data for a stock, optionally limited to the given fields"""
+        try:
+            ticker = self._ticker(symbol)
+            
+            wanted = None if fields is None else set(fields)
+            selected = [
+                row for row in FUNDAMENTAL_FIELDS
+                if wanted is None or row[0] in wanted
+            ]
+            
+            # fast_info avoids the heavy quoteSummary request, so use it when it covers every field
+            if selected and all(out_key in FAST_INFO_FIELDS for out_key, _, _ in selected):
+                fast_info = self._with_retries(lambda: ticker.fast_info)
+                values = {
+                    out_key: fast_info.get(FAST_INFO_FIELDS[out_key]) or default
+                    for out_key, _, default in selected
+                }
+            else:
+                info = self._with_retries(lambda: ticker.info)
+                values = {
+                    out_key: info.get(info_key, default)
+                    for out_key, info_key, default in selected
+                }
             
             fundamental_data = {
                 'symbol': symbol,
-                'company_name': info.get('longName', ''),
-                'sector': info.get('sector', ''),
-                'industry': info.get('industry', ''),
-                'market_cap': info.get('marketCap', 0),
-                'pe_ratio': info.get('trailingPE', 0),
-                'pb_ratio': info.get('priceToBook', 0),
-                'dividend_yield': info.get('dividendYield', 0),
-                'beta': info.get('beta', 0),
-                'roe': info.get('returnOnEquity', 0),
-                'roa': info.get('returnOnAssets', 0),
-                'debt_to_equity': info.get('debtToEquity', 0),
-                'current_ratio': info.get('currentRatio', 0),
-                'quick_ratio': info.get('quickRatio', 0),
-                'gross_margin': info.get('grossMargins', 0),
-                'operating_margin': info.get('operatingMargins', 0),
-                'net_margin': info.get('netIncomeToCommon', 0),
-                'revenue_growth': info.get('revenueGrowth', 0),
-                'earnings_growth': info.get('earningsGrowth', 0),
-                'book_value': info.get('bookValue', 0),
-                'cash_per_share': info.get('totalCashPerShare', 0),
-                'revenue_per_share': info.get('revenuePerShare', 0),
-                'earnings_per_share': info.get('trailingEps', 0),
-                'forward_pe': info.get('forwardPE', 0),
-                'peg_ratio': info.get('pegRatio', 0),
-                'price_to_sales': info.get('priceToSalesTrailing12Months', 0),
-                'enterprise_value': info.get('enterpriseValue', 0),
-                'enterprise_to_revenue': info.get('enterpriseToRevenue', 0),
-                'enterprise_to_ebitda': info.get('enterpriseToEbitda', 0),
-                'shares_outstanding': info.get('sharesOutstanding', 0),
-                'float_shares': info.get('floatShares', 0),
-                'insider_ownership': info.get('heldPercentInsiders', 0),
-                'institutional_ownership': info.get('heldPercentInstitutions', 0),
-                'short_ratio': info.get('shortRatio', 0),
-                'short_percent_of_float': info.get('shortPercentOfFloat', 0),
-                'fifty_two_week_high': info.get('fiftyTwoWeekHigh', 0),
-                'fifty_two_week_low': info.get('fiftyTwoWeekLow', 0),
-                'fifty_day_average': info.get('fiftyDayAverage', 0),
-                'two_hundred_day_average': info.get('twoHundredDayAverage', 0),
-                'volume': info.get('volume', 0),
-                'avg_volume': info.get('averageVolume', 0),
-                'last_updated': datetime.now()
+                **values,
+                'last_updated': _now or datetime.now()
             }
             
             return fundamental_data
@@ -110,20 +325,21 @@ class StockDataFetcher:
             logger.error(f"Error fetching fundamental data for {symbol}: {str(e)}")
             return {}
     
-    def get_earnings_data(self, symbol: str) -> Dict:
+    @cached('earnings', ttl=CONFIG.STATEMENT_CACHE_TTL)
+    def get_earnings_data(self, symbol: str, _now: Optional[datetime] = None) -> Dict:
         """Fetch earnings data for a stock"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = self._ticker(symbol)
             
             # Get earnings
-            earnings = ticker.earnings
-            quarterly_earnings = ticker.quarterly_earnings
+            earnings = self._with_retries(lambda: ticker.earnings)
+            quarterly_earnings = self._with_retries(lambda: ticker.quarterly_earnings)
             
             earnings_data = {
                 'symbol': symbol,
-                'annual_earnings': earnings.to_dict('records') if not earnings.empty else [],
-                'quarterly_earnings': quarterly_earnings.to_dict('records') if not quarterly_earnings.empty else [],
-                'last_updated': datetime.now()
+                'annual_earnings': self._serialize_frame(earnings) if not earnings.empty else {},
+                'quarterly_earnings': self._serialize_frame(quarterly_earnings) if not quarterly_earnings.empty else {},
+                'last_updated': _now or datetime.now()
             }
             
             return earnings_data
@@ -132,95 +348,104 @@ class StockDataFetcher:
             logger.error(f"Error fetching earnings data for {symbol}: {str(e)}")
             return {}
     
-    def get_balance_sheet(self, symbol: str) -> Dict:
+    @cached('balance_sheet', ttl=CONFIG.STATEMENT_CACHE_TTL)
+    def get_balance_sheet(self, symbol: str, _now: Optional[datetime] = None) -> Dict:
         """Fetch balance sheet data"""
         try:
-            ticker = yf.Ticker(symbol)
-            balance_sheet = ticker.balance_sheet
+            ticker = self._ticker(symbol)
+            balance_sheet = self._with_retries(lambda: ticker.balance_sheet)
             
             if balance_sheet.empty:
                 return {}
             
             return {
                 'symbol': symbol,
-                'balance_sheet': balance_sheet.to_dict('records'),
-                'last_updated': datetime.now()
+                'balance_sheet': self._serialize_frame(balance_sheet),
+                'last_updated': _now or datetime.now()
             }
             
         except Exception as e:
             logger.error(f"Error fetching balance sheet for {symbol}: {str(e)}")
             return {}
     
-    def get_income_statement(self, symbol: str) -> Dict:
+    @cached('income_statement', ttl=CONFIG.STATEMENT_CACHE_TTL)
+    def get_income_statement(self, symbol: str, _now: Optional[datetime] = None) -> Dict:
         """Fetch income statement data"""
         try:
-            ticker = yf.Ticker(symbol)
-            income_stmt = ticker.income_stmt
+            ticker = self._ticker(symbol)
+            income_stmt = self._with_retries(lambda: ticker.income_stmt)
             
             if income_stmt.empty:
                 return {}
             
             return {
                 'symbol': symbol,
-                'income_statement': income_stmt.to_dict('records'),
-                'last_updated': datetime.now()
+                'income_statement': self._serialize_frame(income_stmt),
+                'last_updated': _now or datetime.now()
             }
             
         except Exception as e:
             logger.error(f"Error fetching income statement for {symbol}: {str(e)}")
             return {}
     
-    def get_cash_flow(self, symbol: str) -> Dict:
+    @cached('cash_flow', ttl=CONFIG.STATEMENT_CACHE_TTL)
+    def get_cash_flow(self, symbol: str, _now: Optional[datetime] = None) -> Dict:
         """Fetch cash flow data"""
         try:
-            ticker = yf.Ticker(symbol)
-            cash_flow = ticker.cashflow
+            ticker = self._ticker(symbol)
+            cash_flow = self._with_retries(lambda: ticker.cashflow)
             
             if cash_flow.empty:
                 return {}
             
             return {
                 'symbol': symbol,
-                'cash_flow': cash_flow.to_dict('records'),
-                'last_updated': datetime.now()
+                'cash_flow': self._serialize_frame(cash_flow),
+                'last_updated': _now or datetime.now()
             }
             
         except Exception as e:
             logger.error(f"Error fetching cash flow for {symbol}: {str(e)}")
             return {}
     
-    def get_analyst_recommendations(self, symbol: str) -> Dict:
+    @cached('recommendations', ttl=CONFIG.FUNDAMENTAL_CACHE_TTL)
+    def get_analyst_recommendations(self, symbol: str, _now: Optional[datetime] = None) -> Dict:
         """Fetch analyst recommendations"""
         try:
-            ticker = yf.Ticker(symbol)
-            recommendations = ticker.recommendations
+            ticker = self._ticker(symbol)
+            recommendations = self._with_retries(lambda: ticker.recommendations)
             
             if recommendations.empty:
                 return {}
             
             return {
                 'symbol': symbol,
-                'recommendations': recommendations.to_dict('records'),
-                'last_updated': datetime.now()
+                'recommendations': self._serialize_frame(recommendations),
+                'last_updated': _now or datetime.now()
             }
             
         except Exception as e:
             logger.error(f"Error fetching analyst recommendations for {symbol}: {str(e)}")
             return {}
     
-    def get_market_sentiment(self, symbol: str) -> Dict:
+    def get_market_sentiment(self, symbol: str, _now: Optional[datetime] = None) -> Dict:
         """Fetch market sentiment data"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = self._ticker(symbol)
+            
+            # Get various sentiment indicators, each fetched once
+            recommendations_mean = self._with_retries(getattr, ticker, 'recommendations_mean', None)
+            recommendations_summary = self._with_retries(getattr, ticker, 'recommendations_summary', None)
+            major_holders = self._with_retries(getattr, ticker, 'major_holders', None)
+            institutional_holders = self._with_retries(getattr, ticker, 'institutional_holders', None)
             
-            # Get various sentiment indicators
             sentiment_data = {
                 'symbol': symbol,
-                'recommendations_mean': ticker.recommendations_mean if hasattr(ticker, 'recommendations_mean') else None,
-                'recommendations_summary': ticker.recommendations_summary if hasattr(ticker, 'recommendations_summary') else None,
-                'major_holders': ticker.major_holders.to_dict('records') if hasattr(ticker, 'major_holders') and not ticker.major_holders.empty else [],
-                'institutional_holders': ticker.institutional_holders.to_dict('records') if hasattr(ticker, 'institutional_holders') and not ticker.institutional_holders.empty else [],
-                'last_updated': datetime.now()
+                'recommendations_mean': recommendations_mean,
+                'recommendations_summary': recommendations_summary,
+                'major_holders': self._serialize_frame(major_holders) if major_holders is not None and not major_holders.empty else {},
+                'institutional_holders': self._serialize_frame(institutional_holders) if institutional_holders is not None and not institutional_holders.empty else {},
+                'last_updated': _now or datetime.now()
             }
             
             return sentiment_data
@@ -229,11 +454,12 @@ class StockDataFetcher:
             logger.error(f"Error fetching market sentiment for {symbol}: {str(e)}")
             return {}
     
-    def get_news_data(self, symbol: str, limit: int = 10) -> List[Dict]:
+    @cached('news', ttl=CONFIG.NEWS_CACHE_TTL)
+    def get_news_data(self, symbol: str, limit: int = 10, _now: Optional[datetime] = None) -> List[Dict]:
         """Fetch news data for a stock"""
         try:
-            ticker = yf.Ticker(symbol)
-            news = ticker.news
+            ticker = self._ticker(symbol)
+            news = self._with_retries(lambda: ticker.news)
             
             if not news:
                 return []
@@ -241,19 +467,16 @@ class StockDataFetcher:
             # Limit the number of news items
             limited_news = news[:limit]
             
-            news_data = []
-            for item in limited_news:
-                news_data.append({
-                    'symbol': symbol,
-                    'title': item.get('title', ''),
-                    'summary': item.get('summary', ''),
-                    'link': item.get('link', ''),
-                    'publisher': item.get('publisher', ''),
-                    'published': item.get('providerPublishTime', ''),
-                    'last_updated': datetime.now()
-                })
+            last_updated = _now or datetime.now()
             
-            return news_data
+            return [
+                {
+                    'symbol': symbol,
+                    **{key: item.get(source, '') for key, source in NEWS_FIELDS},
+                    'last_updated': last_updated
+                }
+                for item in limited_news
+            ]
             
         except Exception as e:
             logger.error(f"Error fetching news for {symbol}: {str(e)}")
@@ -262,36 +485,29 @@ class StockDataFetcher:
     def get_sector_performance(self) -> Dict:
         """Fetch sector performance data"""
         try:
-            # Get sector ETFs for performance comparison
-            sector_etfs = {
-                'XLK': 'Technology',
-                'XLF': 'Financials',
-                'XLE': 'Energy',
-                'XLV': 'Healthcare',
-                'XLI': 'Industrials',
-                'XLP': 'Consumer Staples',
-                'XLY': 'Consumer Discretionary',
-                'XLB': 'Materials',
-                'XLU': 'Utilities',
-                'XLRE': 'Real Estate'
-            }
-            
-            sector_data = {}
-            for etf, sector in sector_etfs.items():
-                try:
-                    data = self.get_stock_data(etf, period="1y")
-                    if not data.empty:
-                        # Calculate YTD return
-                        ytd_return = ((data.iloc[-1]['Close'] - data.iloc[0]['Close']) / data.iloc[0]['Close']) * 100
-                        sector_data[sector] = {
-                            'etf': etf,
-                            'ytd_return': ytd_return,
-                            'current_price': data.iloc[-1]['Close'],
-                            'volume': data.iloc[-1]['Volume']
-                        }
-                except Exception as e:
-                    logger.warning(f"Error fetching data for {etf}: {str(e)}")
-                    continue
+            # Fetch all ETFs in parallel; results are read back in the original order
+            with ThreadPoolExecutor(max_workers=CONFIG.MAX_MARKET_DATA_WORKERS) as executor:
+                futures = {etf: executor.submit(self.get_stock_data, etf, "1y") for etf in SECTOR_ETFS}
+                
+                sector_data = {}
+                for etf, sector in SECTOR_ETFS.items():
+                    try:
+                        data = futures[etf].result()
+                        if not data.empty:
+                            close = data['Close'].to_numpy()
+                            volume = data['Volume'].to_numpy()
+                            
+                            # Calculate YTD return
+                            ytd_return = ((close[-1] - close[0]) / close[0]) * 100
+                            sector_data[sector] = {
+                                'etf': etf,
+                                'ytd_return': float(ytd_return),
+                                'current_price': float(close[-1]),
+                                'volume': int(volume[-1])
+                            }
+                    except Exception as e:
+                        logger.warning(f"Error fetching data for {etf}: {str(e)}")
+                        continue
             
             return sector_data
             
@@ -302,29 +518,29 @@ class StockDataFetcher:
     def get_market_overview(self) -> Dict:
         """Get overall market overview"""
         try:
-            # Get major indices
-            indices = {
-                '^GSPC': 'S&P 500',
-                '^DJI': 'Dow Jones',
-                '^IXIC': 'NASDAQ',
-                '^VIX': 'VIX Volatility'
-            }
-            
-            market_data = {}
-            for symbol, name in indices.items():
-                try:
-                    data = self.get_stock_data(symbol, period="1d")
-                    if not data.empty:
-                        market_data[name] = {
-                            'symbol': symbol,
-                            'current_value': data.iloc[-1]['Close'],
-                            'change': data.iloc[-1]['Close'] - data.iloc[-1]['Open'],
-                            'change_percent': ((data.iloc[-1]['Close'] - data.iloc[-1]['Open']) / data.iloc[-1]['Open']) * 100,
-                            'volume': data.iloc[-1]['Volume']
-                        }
-                except Exception as e:
-                    logger.warning(f"Error fetching data for {symbol}: {str(e)}")
-                    continue
+            # Fetch all indices in parallel
+            with ThreadPoolExecutor(max_workers=CONFIG.MAX_MARKET_DATA_WORKERS) as executor:
+                futures = {symbol: executor.submit(self.get_stock_data, symbol, "1d") for symbol in INDICES}
+                
+                market_data = {}
+                for symbol, name in INDICES.items():
+                    try:
+                        data = futures[symbol].result()
+                        if not data.empty:
+                            close = float(data['Close'].to_numpy()[-1])
+                            open_price = float(data['Open'].to_numpy()[-1])
+                            volume = int(data['Volume'].to_numpy()[-1])
+                            
+                            market_data[name] = {
+                                'symbol': symbol,
+                                'current_value': close,
+                                'change': close - open_price,
+                                'change_percent': ((close - open_price) / open_price) * 100,
+                                'volume': volume
+                            }
+                    except Exception as e:
+                        logger.warning(f"Error fetching data for {symbol}: {str(e)}")
+                        continue
             
             return market_data
             
@@ -332,27 +548,103 @@ class StockDataFetcher:
             logger.error(f"Error fetching market overview: {str(e)}")
             return {}
     
-    def batch_fetch_data(self, symbols: List[str], data_types: List[str] = None) -> Dict:
-        """Fetch multiple types of data for multiple symbols"""
-        if data_types is None:
-            data_types = ['price', 'fundamental', 'earnings']
+    def get_bulk_stock_data(self, symbols: List[str], period: str = "1y", interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """Fetch price history for many symbols with a single yfinance download"""
+        try:
+            bulk = self._with_retries(
+                yf.download,
+                symbols,
+                period=period,
+                interval=interval,
+                group_by='ticker',
+                auto_adjust=True,
+                actions=True,
+                threads=True,
+                progress=False
+            )
+        except Exception as e:
+            logger.error(f"Error downloading bulk price data: {str(e)}")
+            return {symbol: pd.DataFrame() for symbol in symbols}
         
         results = {}
+        tickers = set(bulk.columns.get_level_values(0)) if isinstance(bulk.columns, pd.MultiIndex) else set()
         
         for symbol in symbols:
-            results[symbol] = {}
-            
-            if 'price' in data_types:
-                results[symbol]['price'] = self.get_stock_data(symbol)
-            
-            if 'fundamental' in data_types:
-                results[symbol]['fundamental'] = self.get_fundamental_data(symbol)
-            
-            if 'earnings' in data_types:
-                results[symbol]['earnings'] = self.get_earnings_data(symbol)
-            
-            # Add delay to avoid rate limiting
-            time.sleep(0.1)
+            # A single-symbol download may come back with flat columns
+            if symbol in tickers:
+                data = bulk[symbol]
+            elif not tickers and len(symbols) == 1:
+                data = bulk
+            else:
+                data = pd.DataFrame()
+            
+            # Symbols with a shorter history are padded with all-NaN rows
+            data = data.dropna(how='all')
+            
+            if data.empty:
+                logger.warning(f"No data found for {symbol}")
+                results[symbol] = pd.DataFrame()
+            else:
+                results[symbol] = self._optimize_price_frame(data, symbol)
         
         return results
-
+    
+    def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Latest price for each symbol from one batched download; symbols without data are omitted"""
+        if not symbols:
+            return {}
+        return self._fetch_current_prices(tuple(sorted(set(symbols))))
+    
+    @ttl_cache(ttl=CONFIG.PRICE_CACHE_TTL)
+    def _fetch_current_prices(self, symbols: Tuple[str, ...]) -> Dict[str, float]:
+        """Last close of a short daily history per symbol; the current session's bar tracks the live price"""
+        prices = {}
+        for symbol, data in self.get_bulk_stock_data(list(symbols), period="5d", interval="1d").items():
+            close = data['Close'].dropna() if not data.empty else data
+            if len(close):
+                prices[symbol] = float(close.iat[-1])
+        return prices
+    
+    async def _fetch_symbol(self, symbol: str, data_types: List[str], semaphore: asyncio.Semaphore, now: datetime) -> Dict:
+        """Fetch the requested per-symbol data types without blocking the event loop"""
+        fetchers = {
+            'fundamental': self.get_fundamental_data,
+            'earnings': self.get_earnings_data
+        }
+        requested = [data_type for data_type in fetchers if data_type in data_types]
+        
+        # yfinance is blocking, so each call runs in a worker thread
+        async with semaphore:
+            results = await asyncio.gather(
+                *(asyncio.to_thread(fetchers[data_type], symbol, _now=now) for data_type in requested)
+            )
+        
+        return dict(zip(requested, results))
+    
+    async def batch_fetch_data(self, symbols: List[str], data_types: List[str] = None) -> Dict:
+        """Fetch multiple types of data for multiple symbols concurrently"""
+        if data_types is None:
+            data_types = ['price', 'fundamental', 'earnings']
+        
+        # Cap the number of symbols in flight to avoid rate limiting
+        semaphore = asyncio.Semaphore(CONFIG.MAX_CONCURRENT_REQUESTS)
+        
+        # One timestamp for the whole batch
+        now = datetime.now()
+        
+        per_symbol = asyncio.gather(
+            *(self._fetch_symbol(symbol, data_types, semaphore, now) for symbol in symbols)
+        )
+        
+        # Price history for every symbol comes from one multi-ticker download
+        if 'price' in data_types:
+            prices, results = await asyncio.gather(
+                asyncio.to_thread(self.get_bulk_stock_data, symbols),
+                per_symbol
+            )
+            for symbol, result in zip(symbols, results):
+                result['price'] = prices.get(symbol, pd.DataFrame())
+        else:
+            results = await per_symbol
+        
+        return dict(zip(symbols, results))
@@ -1,17 +1,48 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from config import Config
+from config import CONFIG
 
 # Create database engine
 engine = create_engine(
-    Config.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in Config.DATABASE_URL else {}
+    CONFIG.DATABASE_URL,
+    connect_args={"check_same_thread": False} if "sqlite" in CONFIG.DATABASE_URL else {},
+    pool_size=CONFIG.DB_POOL_SIZE,
+    max_overflow=CONFIG.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=CONFIG.DB_POOL_RECYCLE
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async drivers for the plain database URL schemes
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg'
+}
+
+def _async_url(url: str) -> str:
+    """Rewrite a database URL to use its async driver; URLs that already name a driver are left as is"""
+    scheme, separator, rest = url.partition('://')
+    return f"{ASYNC_DRIVERS[scheme]}{separator}{rest}" if scheme in ASYNC_DRIVERS else url
+
+def _async_pool_args(url: str) -> dict:
+    """Pool sizing for the async engine; aiosqlite picks its own pool (NullPool on older SQLAlchemy), which takes no size"""
+    if "sqlite" in url:
+        return {}
+    return {'pool_size': CONFIG.DB_POOL_SIZE, 'max_overflow': CONFIG.DB_MAX_OVERFLOW}
+
+# Async engine for request handlers, so queries don't block the event loop
+async_engine = create_async_engine(
+    _async_url(CONFIG.DATABASE_URL),
+    **_async_pool_args(CONFIG.DATABASE_URL),
+    pool_pre_ping=True,
+    pool_recycle=CONFIG.DB_POOL_RECYCLE
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 # Create base class for models
 Base = declarative_base()
 
@@ -23,6 +54,11 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def create_tables():
     """Create all database tables"""
     Base.metadata.create_all(bind=engine)
@@ -1,317 +1,305 @@
-import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import logging
-from config import Config
+from bisect import bisect_right
+from config import CONFIG
+from _njit import njit
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Score ladders: (cutoffs, points, side). The number of cutoffs a value passes indexes its
+# points; side='right' encodes strict "<" ladders (lower is better), side='left' strict ">"
+PE_LADDER = ((15, 25, 35), (30, 20, 10, 0), 'right')
+PB_LADDER = ((1, 2, 3), (25, 20, 10, 0), 'right')
+PS_LADDER = ((1, 2, 3), (25, 20, 10, 0), 'right')
+ROE_LADDER = ((0.05, 0.10, 0.15, 0.20), (0, 10, 15, 20, 25), 'left')
+ROA_LADDER = ((0.05, 0.10, 0.15), (5, 10, 15, 20), 'left')
+GROSS_MARGIN_LADDER = ((0.20, 0.30, 0.40), (5, 10, 15, 20), 'left')
+OPERATING_MARGIN_LADDER = ((0.10, 0.15, 0.20), (5, 10, 15, 20), 'left')
+NET_MARGIN_LADDER = ((0.05, 0.10, 0.15), (0, 5, 10, 15), 'left')
+REVENUE_GROWTH_LADDER = ((0.05, 0.10, 0.15, 0.20), (10, 15, 20, 25, 30), 'left')
+EARNINGS_GROWTH_LADDER = ((0.10, 0.15, 0.20, 0.25), (15, 20, 25, 30, 35), 'left')
+DEBT_TO_EQUITY_LADDER = ((0.3, 0.5, 0.7, 1.0), (25, 20, 15, 10, 0), 'right')
+QUICK_RATIO_LADDER = ((0.6, 0.8, 1.0), (5, 10, 15, 20), 'left')
+
+# Score bands: (inclusive lower bounds, inclusive upper bounds, points), outermost band first.
+# A value's level is the number of nested bands it falls inside
+PEG_BANDS = ((0.5, 0.8), (1.2, 2.0), (5, 15, 20))
+CURRENT_RATIO_BANDS = ((1.0, 1.2, 1.5), (3.0, 4.0, 5.0), (5, 15, 20, 25))
+
+# Discount rate for the simplified DCF/DDM valuations, and its five-year compounding
+DISCOUNT_RATE = 0.10
+DCF_DISCOUNT_5Y = (1 + DISCOUNT_RATE) ** 5
+
+# Overall score -> (signal, strength, reason template); a score at a cutoff takes the higher entry
+SIGNAL_CUTS = (50, 60, 70, 80)
+SIGNAL_TABLE = (
+    ('sell', 0.7, 'Poor fundamental score: %.1f/100'),
+    ('hold', 0.5, 'Below average fundamental score: %.1f/100'),
+    ('hold', 0.6, 'Fair fundamental score: %.1f/100'),
+    ('buy', 0.7, 'Good fundamental score: %.1f/100'),
+    ('buy', 0.9, 'Excellent fundamental score: %.1f/100')
+)
+RECOMMENDATIONS = ("Sell", "Weak Hold", "Hold", "Buy", "Strong Buy")
+
+GRADE_CUTS = (30, 40, 50, 60, 70, 80, 90)
+GRADES = ("F", "D", "C", "C+", "B", "B+", "A", "A+")
+
+# Report summary labels per category: (category, strength at >= 70, weakness below 50)
+SUMMARY_LABELS = (
+    ('valuation', "Strong valuation metrics", "Poor valuation metrics"),
+    ('profitability', "High profitability", "Low profitability"),
+    ('growth', "Strong growth trajectory", "Weak growth"),
+    ('financial_health', "Solid financial health", "Poor financial health")
+)
+
+# Report insight rules per category:
+# (metric, only if positive, low cutoff, message below it, high cutoff, message above it)
+INSIGHT_RULES = {
+    'valuation': (
+        ('pe_ratio', True, 15, "P/E ratio indicates excellent value", 30, "P/E ratio suggests overvaluation"),
+        ('pb_ratio', True, 1, "P/B ratio indicates strong asset value", 3, "P/B ratio suggests premium pricing")
+    ),
+    'profitability': (
+        ('roe', False, 0.05, "Poor return on equity", 0.20, "Excellent return on equity"),
+        ('gross_margin', False, 0.20, "Weak gross margins", 0.40, "Strong gross margins")
+    ),
+    'growth': (
+        ('revenue_growth', False, 0.05, "Weak revenue growth", 0.20, "Strong revenue growth"),
+        ('earnings_growth', False, 0.10, "Poor earnings growth", 0.25, "Excellent earnings growth")
+    ),
+    'financial_health': (
+        ('debt_to_equity', False, 0.3, "Low debt levels", 1.0, "High debt levels"),
+        ('current_ratio', False, 1.0, "Weak liquidity position", 2.0, "Strong liquidity position")
+    )
+}
+
+# Argument order of _score_kernel
+SCORED_METRICS = (
+    'pe_ratio', 'pb_ratio', 'price_to_sales', 'peg_ratio', 'roe', 'roa', 'gross_margin',
+    'operating_margin', 'net_margin', 'revenue_growth', 'earnings_growth', 'book_value',
+    'cash_per_share', 'debt_to_equity', 'current_ratio', 'quick_ratio'
+)
+
+def _as_number(value) -> float:
+    """Treat missing, NaN or non-numeric metrics (e.g. None from a cached NaN) as 0"""
+    if isinstance(value, (int, float, np.integer, np.floating)) and value == value:
+        return float(value)
+    return 0.0
+
+@njit(cache=True, nogil=True)
+def _ladder_score(ladder: Tuple, value: float) -> int:
+    """Score a single value against a cutoff ladder"""
+    cuts, points, side = ladder
+    passed = 0
+    for cut in cuts:
+        if cut < value or (side == 'right' and cut == value):
+            passed += 1
+    return points[passed]
+
+@njit(cache=True, nogil=True)
+def _band_score(bands: Tuple, value: float) -> int:
+    """Score a single value against nested inclusive bands"""
+    lower, upper, points = bands
+    inside_lower = 0
+    for bound in lower:
+        if bound <= value:
+            inside_lower += 1
+    outside_upper = 0
+    for bound in upper:
+        if bound < value:
+            outside_upper += 1
+    return points[min(inside_lower, len(upper) - outside_upper)]
+
+@njit(cache=True, nogil=True)
+def _score_kernel(pe_ratio, pb_ratio, price_to_sales, peg_ratio, roe, roa, gross_margin,
+                  operating_margin, net_margin, revenue_growth, earnings_growth, book_value,
+                  cash_per_share, debt_to_equity, current_ratio, quick_ratio):
+    """Compiled category scoring; NaN metrics fail every comparison and score as missing"""
+    # Valuation: P/E, P/B, P/S (lower is better) and PEG (closer to 1 is better)
+    valuation = 0
+    if pe_ratio > 0:
+        valuation += _ladder_score(PE_LADDER, pe_ratio)
+    if pb_ratio > 0:
+        valuation += _ladder_score(PB_LADDER, pb_ratio)
+    if price_to_sales > 0:
+        valuation += _ladder_score(PS_LADDER, price_to_sales)
+    if peg_ratio > 0:
+        valuation += _band_score(PEG_BANDS, peg_ratio)
+    
+    # Profitability: returns and margins (higher is better)
+    profitability = 0
+    if roe > 0:
+        profitability += _ladder_score(ROE_LADDER, roe)
+    if roa > 0:
+        profitability += _ladder_score(ROA_LADDER, roa)
+    if gross_margin > 0:
+        profitability += _ladder_score(GROSS_MARGIN_LADDER, gross_margin)
+    if operating_margin > 0:
+        profitability += _ladder_score(OPERATING_MARGIN_LADDER, operating_margin)
+    if net_margin > 0:
+        profitability += _ladder_score(NET_MARGIN_LADDER, net_margin)
+    
+    # Growth: revenue and earnings growth, plus book value and cash placeholders
+    # (proper book value and cash flow growth would need historical data)
+    growth = 0
+    if revenue_growth > 0:
+        growth += _ladder_score(REVENUE_GROWTH_LADDER, revenue_growth)
+    if earnings_growth > 0:
+        growth += _ladder_score(EARNINGS_GROWTH_LADDER, earnings_growth)
+    if book_value > 0:
+        growth += 20
+    if cash_per_share > 0:
+        growth += 15
+    
+    # Financial health: leverage and liquidity; interest coverage is a placeholder
+    # until EBIT and interest expense data are available
+    financial_health = 15
+    if debt_to_equity > 0:
+        financial_health += _ladder_score(DEBT_TO_EQUITY_LADDER, debt_to_equity)
+    if current_ratio > 0:
+        financial_health += _band_score(CURRENT_RATIO_BANDS, current_ratio)
+    if quick_ratio > 0:
+        financial_health += _ladder_score(QUICK_RATIO_LADDER, quick_ratio)
+    if cash_per_share > 0:
+        financial_health += 15  # Good cash position
+    
+    return min(valuation, 100), min(profitability, 100), min(growth, 100), min(financial_health, 100)
+
+def _ladder_scores(ladder: Tuple, values: np.ndarray) -> np.ndarray:
+    """Score an array of values against a cutoff ladder"""
+    cuts, points, side = ladder
+    return np.asarray(points)[np.searchsorted(cuts, values, side=side)]
+
+def _band_scores(bands: Tuple, values: np.ndarray) -> np.ndarray:
+    """Score an array of values against nested inclusive bands"""
+    lower, upper, points = bands
+    level = np.minimum(
+        np.searchsorted(lower, values, side='right'),
+        len(upper) - np.searchsorted(upper, values, side='left')
+    )
+    return np.asarray(points)[level]
+
 class FundamentalAnalyzer:
     """Comprehensive fundamental analysis for stocks"""
     
-    def __init__(self):
-        self.min_market_cap = Config.MIN_MARKET_CAP
-        self.max_pe_ratio = Config.MAX_PE_RATIO
-        self.min_volume = Config.MIN_VOLUME
+    # Stateless: no per-instance __dict__, thresholds live on the class
+    __slots__ = ()
+    
+    # Screening thresholds, read from the config once at import time
+    min_market_cap = CONFIG.MIN_MARKET_CAP
+    max_pe_ratio = CONFIG.MAX_PE_RATIO
+    min_volume = CONFIG.MIN_VOLUME
     
     def calculate_fundamental_score(self, fundamental_data: Dict) -> Dict:
         """Calculate comprehensive fundamental score for a stock"""
         if not fundamental_data:
             return {}
         
-        try:
-            scores = {}
-            
-            # Valuation score
-            scores['valuation'] = self._calculate_valuation_score(fundamental_data)
-            
-            # Profitability score
-            scores['profitability'] = self._calculate_profitability_score(fundamental_data)
-            
-            # Growth score
-            scores['growth'] = self._calculate_growth_score(fundamental_data)
-            
-            # Financial health score
-            scores['financial_health'] = self._calculate_financial_health_score(fundamental_data)
-            
-            # Overall score (weighted average)
-            overall_score = self._calculate_overall_score(scores)
-            scores['overall'] = overall_score
-            
-            # Add all metrics
-            scores['metrics'] = fundamental_data
-            
-            return scores
-            
-        except Exception as e:
-            logger.error(f"Error calculating fundamental score: {str(e)}")
-            return {}
-    
-    def _calculate_valuation_score(self, data: Dict) -> float:
-        """Calculate valuation score based on P/E, P/B, P/S ratios"""
-        score = 0
-        max_score = 100
+        # Inputs are coerced to clean floats, so the table lookups cannot raise
+        valuation, profitability, growth, financial_health = self._score_all(fundamental_data)
         
-        try:
-            # P/E Ratio (lower is better, but not too low)
-            pe_ratio = data.get('pe_ratio', 0)
-            if pe_ratio > 0:
-                if pe_ratio < 15:
-                    score += 30  # Excellent value
-                elif pe_ratio < 25:
-                    score += 20  # Good value
-                elif pe_ratio < 35:
-                    score += 10  # Fair value
-                else:
-                    score += 0   # Overvalued
-            
-            # P/B Ratio (lower is better)
-            pb_ratio = data.get('pb_ratio', 0)
-            if pb_ratio > 0:
-                if pb_ratio < 1:
-                    score += 25  # Excellent value
-                elif pb_ratio < 2:
-                    score += 20  # Good value
-                elif pb_ratio < 3:
-                    score += 10  # Fair value
-                else:
-                    score += 0   # Overvalued
-            
-            # P/S Ratio (lower is better)
-            price_to_sales = data.get('price_to_sales', 0)
-            if price_to_sales > 0:
-                if price_to_sales < 1:
-                    score += 25  # Excellent value
-                elif price_to_sales < 2:
-                    score += 20  # Good value
-                elif price_to_sales < 3:
-                    score += 10  # Fair value
-                else:
-                    score += 0   # Overvalued
-            
-            # PEG Ratio (closer to 1 is better)
-            peg_ratio = data.get('peg_ratio', 0)
-            if peg_ratio > 0:
-                if 0.8 <= peg_ratio <= 1.2:
-                    score += 20  # Excellent value
-                elif 0.5 <= peg_ratio <= 2.0:
-                    score += 15  # Good value
-                else:
-                    score += 5   # Fair value
-            
-        except Exception as e:
-            logger.error(f"Error calculating valuation score: {str(e)}")
+        scores = {
+            'valuation': valuation,
+            'profitability': profitability,
+            'growth': growth,
+            'financial_health': financial_health,
+            # Overall score (equally weighted average)
+            'overall': 0.25 * (valuation + profitability + growth + financial_health)
+        }
         
-        return min(score, max_score)
-    
-    def _calculate_profitability_score(self, data: Dict) -> float:
-        """Calculate profitability score based on margins and returns"""
-        score = 0
-        max_score = 100
+        # Add all metrics
+        scores['metrics'] = fundamental_data
         
-        try:
-            # Return on Equity (higher is better)
-            roe = data.get('roe', 0)
-            if roe > 0:
-                if roe > 0.20:
-                    score += 25  # Excellent
-                elif roe > 0.15:
-                    score += 20  # Good
-                elif roe > 0.10:
-                    score += 15  # Fair
-                elif roe > 0.05:
-                    score += 10  # Poor
-                else:
-                    score += 0   # Very poor
-            
-            # Return on Assets (higher is better)
-            roa = data.get('roa', 0)
-            if roa > 0:
-                if roa > 0.15:
-                    score += 20  # Excellent
-                elif roa > 0.10:
-                    score += 15  # Good
-                elif roa > 0.05:
-                    score += 10  # Fair
-                else:
-                    score += 5   # Poor
-            
-            # Gross Margin (higher is better)
-            gross_margin = data.get('gross_margin', 0)
-            if gross_margin > 0:
-                if gross_margin > 0.40:
-                    score += 20  # Excellent
-                elif gross_margin > 0.30:
-                    score += 15  # Good
-                elif gross_margin > 0.20:
-                    score += 10  # Fair
-                else:
-                    score += 5   # Poor
-            
-            # Operating Margin (higher is better)
-            operating_margin = data.get('operating_margin', 0)
-            if operating_margin > 0:
-                if operating_margin > 0.20:
-                    score += 20  # Excellent
-                elif operating_margin > 0.15:
-                    score += 15  # Good
-                elif operating_margin > 0.10:
-                    score += 10  # Fair
-                else:
-                    score += 5   # Poor
-            
-            # Net Margin (higher is better)
-            net_margin = data.get('net_margin', 0)
-            if net_margin > 0:
-                if net_margin > 0.15:
-                    score += 15  # Excellent
-                elif net_margin > 0.10:
-                    score += 10  # Good
-                elif net_margin > 0.05:
-                    score += 5   # Fair
-                else:
-                    score += 0   # Poor
-            
-        except Exception as e:
-            logger.error(f"Error calculating profitability score: {str(e)}")
-        
-        return min(score, max_score)
+        return scores
     
-    def _calculate_growth_score(self, data: Dict) -> float:
-        """Calculate growth score based on revenue and earnings growth"""
-        score = 0
-        max_score = 100
-        
-        try:
-            # Revenue Growth (higher is better)
-            revenue_growth = data.get('revenue_growth', 0)
-            if revenue_growth > 0:
-                if revenue_growth > 0.20:
-                    score += 30  # Excellent
-                elif revenue_growth > 0.15:
-                    score += 25  # Good
-                elif revenue_growth > 0.10:
-                    score += 20  # Fair
-                elif revenue_growth > 0.05:
-                    score += 15  # Poor
-                else:
-                    score += 10  # Very poor
-            
-            # Earnings Growth (higher is better)
-            earnings_growth = data.get('earnings_growth', 0)
-            if earnings_growth > 0:
-                if earnings_growth > 0.25:
-                    score += 35  # Excellent
-                elif earnings_growth > 0.20:
-                    score += 30  # Good
-                elif earnings_growth > 0.15:
-                    score += 25  # Fair
-                elif earnings_growth > 0.10:
-                    score += 20  # Poor
-                else:
-                    score += 15  # Very poor
-            
-            # Book Value Growth
-            book_value = data.get('book_value', 0)
-            if book_value > 0:
-                # This would need historical data for proper calculation
-                score += 20  # Placeholder
-            
-            # Cash Flow Growth
-            cash_per_share = data.get('cash_per_share', 0)
-            if cash_per_share > 0:
-                # This would need historical data for proper calculation
-                score += 15  # Placeholder
-            
-        except Exception as e:
-            logger.error(f"Error calculating growth score: {str(e)}")
+    def calculate_fundamental_scores_batch(self, records: List[Dict]) -> 'pd.DataFrame':
+        """Calculate category and overall fundamental scores for many stocks at once"""
+        # pandas is only needed by the batch and peer paths; single-stock scoring skips the import
+        import pandas as pd
         
-        return min(score, max_score)
-    
-    def _calculate_financial_health_score(self, data: Dict) -> float:
-        """Calculate financial health score based on debt and liquidity"""
-        score = 0
-        max_score = 100
+        columns = ['valuation', 'profitability', 'growth', 'financial_health', 'overall']
+        if not records:
+            return pd.DataFrame(columns=columns)
         
         try:
-            # Debt to Equity (lower is better)
-            debt_to_equity = data.get('debt_to_equity', 0)
-            if debt_to_equity > 0:
-                if debt_to_equity < 0.3:
-                    score += 25  # Excellent
-                elif debt_to_equity < 0.5:
-                    score += 20  # Good
-                elif debt_to_equity < 0.7:
-                    score += 15  # Fair
-                elif debt_to_equity < 1.0:
-                    score += 10  # Poor
-                else:
-                    score += 0   # Very poor
-            
-            # Current Ratio (higher is better, but not too high)
-            current_ratio = data.get('current_ratio', 0)
-            if current_ratio > 0:
-                if 1.5 <= current_ratio <= 3.0:
-                    score += 25  # Excellent
-                elif 1.2 <= current_ratio <= 4.0:
-                    score += 20  # Good
-                elif 1.0 <= current_ratio <= 5.0:
-                    score += 15  # Fair
-                else:
-                    score += 5   # Poor
-            
-            # Quick Ratio (higher is better)
-            quick_ratio = data.get('quick_ratio', 0)
-            if quick_ratio > 0:
-                if quick_ratio > 1.0:
-                    score += 20  # Excellent
-                elif quick_ratio > 0.8:
-                    score += 15  # Good
-                elif quick_ratio > 0.6:
-                    score += 10  # Fair
-                else:
-                    score += 5   # Poor
-            
-            # Interest Coverage (higher is better)
-            # This would need EBIT and interest expense data
-            score += 15  # Placeholder
-            
-            # Cash Position
-            cash_per_share = data.get('cash_per_share', 0)
-            if cash_per_share > 0:
-                score += 15  # Good cash position
+            frame = pd.DataFrame.from_records(records)
+            zeros = np.zeros(len(frame))
+            
+            def metric(name: str) -> np.ndarray:
+                # Missing or non-numeric values score like a missing metric (0)
+                if name not in frame:
+                    return zeros
+                return pd.to_numeric(frame[name], errors='coerce').fillna(0).to_numpy(dtype=float)
+            
+            def ladder(values: np.ndarray, table: Tuple) -> np.ndarray:
+                # Only positive values are scored, as in the per-stock path
+                return np.where(values > 0, _ladder_scores(table, values), 0)
+            
+            def bands(values: np.ndarray, table: Tuple) -> np.ndarray:
+                return np.where(values > 0, _band_scores(table, values), 0)
+            
+            cash = metric('cash_per_share')
+            
+            valuation = (
+                ladder(metric('pe_ratio'), PE_LADDER)
+                + ladder(metric('pb_ratio'), PB_LADDER)
+                + ladder(metric('price_to_sales'), PS_LADDER)
+                + bands(metric('peg_ratio'), PEG_BANDS)
+            )
+            
+            profitability = (
+                ladder(metric('roe'), ROE_LADDER)
+                + ladder(metric('roa'), ROA_LADDER)
+                + ladder(metric('gross_margin'), GROSS_MARGIN_LADDER)
+                + ladder(metric('operating_margin'), OPERATING_MARGIN_LADDER)
+                + ladder(metric('net_margin'), NET_MARGIN_LADDER)
+            )
+            
+            growth = (
+                ladder(metric('revenue_growth'), REVENUE_GROWTH_LADDER)
+                + ladder(metric('earnings_growth'), EARNINGS_GROWTH_LADDER)
+                + np.where(metric('book_value') > 0, 20, 0)
+                + np.where(cash > 0, 15, 0)
+            )
+            
+            financial_health = (
+                ladder(metric('debt_to_equity'), DEBT_TO_EQUITY_LADDER)
+                + bands(metric('current_ratio'), CURRENT_RATIO_BANDS)
+                + ladder(metric('quick_ratio'), QUICK_RATIO_LADDER)
+                + 15  # Interest coverage placeholder
+                + np.where(cash > 0, 15, 0)
+            )
+            
+            scores = pd.DataFrame({
+                'valuation': np.minimum(valuation, 100),
+                'profitability': np.minimum(profitability, 100),
+                'growth': np.minimum(growth, 100),
+                'financial_health': np.minimum(financial_health, 100)
+            }, index=frame.index)
+            
+            # Equally weighted average, as in calculate_fundamental_score
+            scores['overall'] = 0.25 * (
+                scores['valuation'] + scores['profitability']
+                + scores['growth'] + scores['financial_health']
+            )
+            
+            if 'symbol' in frame:
+                scores.insert(0, 'symbol', frame['symbol'])
             
-        except Exception as e:
-            logger.error(f"Error calculating financial health score: {str(e)}")
-        
-        return min(score, max_score)
-    
-    def _calculate_overall_score(self, scores: Dict) -> float:
-        """Calculate overall fundamental score as weighted average"""
-        try:
-            weights = {
-                'valuation': 0.25,
-                'profitability': 0.25,
-                'growth': 0.25,
-                'financial_health': 0.25
-            }
-            
-            total_score = 0
-            total_weight = 0
-            
-            for category, weight in weights.items():
-                if category in scores and isinstance(scores[category], (int, float)):
-                    total_score += scores[category] * weight
-                    total_weight += weight
-            
-            if total_weight == 0:
-                return 0
-            
-            return total_score / total_weight
+            return scores
             
         except Exception as e:
-            logger.error(f"Error calculating overall score: {str(e)}")
-            return 0
+            logger.error(f"Error calculating batch fundamental scores: {str(e)}")
+            return pd.DataFrame(columns=columns)
+    
+    def _score_all(self, data: Dict) -> Tuple[int, int, int, int]:
+        """Score valuation, profitability, growth and financial health in one pass over the metrics"""
+        g = data.get
+        return _score_kernel(*(_as_number(g(key, 0)) for key in SCORED_METRICS))
     
     def generate_fundamental_signals(self, fundamental_data: Dict) -> Dict:
         """Generate buy/sell signals based on fundamental analysis"""
@@ -328,26 +316,8 @@ class FundamentalAnalyzer:
             overall_score = scores.get('overall', 0)
             
             # Generate signal based on overall score
-            if overall_score >= 80:
-                signal = 'buy'
-                strength = 0.9
-                reason = f'Excellent fundamental score: {overall_score:.1f}/100'
-            elif overall_score >= 70:
-                signal = 'buy'
-                strength = 0.7
-                reason = f'Good fundamental score: {overall_score:.1f}/100'
-            elif overall_score >= 60:
-                signal = 'hold'
-                strength = 0.6
-                reason = f'Fair fundamental score: {overall_score:.1f}/100'
-            elif overall_score >= 50:
-                signal = 'hold'
-                strength = 0.5
-                reason = f'Below average fundamental score: {overall_score:.1f}/100'
-            else:
-                signal = 'sell'
-                strength = 0.7
-                reason = f'Poor fundamental score: {overall_score:.1f}/100'
+            signal, strength, template = SIGNAL_TABLE[bisect_right(SIGNAL_CUTS, overall_score)]
+            reason = template % overall_score
             
             return {
                 'signal': signal,
@@ -375,61 +345,46 @@ class FundamentalAnalyzer:
         try:
             metrics = {}
             
+            get = fundamental_data.get
+            eps = get('earnings_per_share', 0)
+            pe = get('pe_ratio', 0)
+            growth_rate = get('earnings_growth', 0.05)  # Default 5%
+            dividend_yield = get('dividend_yield', 0)
+            ev = get('enterprise_value', 0)
+            market_cap = get('market_cap', 0)
+            book_value = get('book_value', 0)
+            shares = get('shares_outstanding', 0)
+            
             # Discounted Cash Flow (DCF) - Simplified
-            if 'earnings_per_share' in fundamental_data and 'pe_ratio' in fundamental_data:
-                eps = fundamental_data.get('earnings_per_share', 0)
-                pe = fundamental_data.get('pe_ratio', 0)
+            if eps > 0 and pe > 0:
+                # Present value of earnings five years out
+                future_eps = eps * (1 + growth_rate) ** 5
+                present_value = future_eps / DCF_DISCOUNT_5Y
                 
-                if eps > 0 and pe > 0:
-                    # Simple DCF calculation
-                    growth_rate = fundamental_data.get('earnings_growth', 0.05)  # Default 5%
-                    discount_rate = 0.10  # 10% discount rate
-                    
-                    # Calculate present value of future earnings
-                    future_eps = eps * (1 + growth_rate) ** 5
-                    present_value = future_eps / (1 + discount_rate) ** 5
-                    
-                    metrics['dcf_value'] = present_value
-                    metrics['dcf_premium'] = (present_value - eps) / eps if eps > 0 else 0
+                metrics['dcf_value'] = present_value
+                metrics['dcf_premium'] = (present_value - eps) / eps
             
             # Dividend Discount Model (DDM)
-            if 'dividend_yield' in fundamental_data and 'earnings_per_share' in fundamental_data:
-                dividend_yield = fundamental_data.get('dividend_yield', 0)
-                eps = fundamental_data.get('earnings_per_share', 0)
+            if dividend_yield > 0 and eps > 0:
+                # Assume payout ratio and growth
+                payout_ratio = dividend_yield * pe if pe > 0 else 0.3
                 
-                if dividend_yield > 0 and eps > 0:
-                    # Assume payout ratio and growth
-                    payout_ratio = dividend_yield * pe if pe > 0 else 0.3
-                    growth_rate = fundamental_data.get('earnings_growth', 0.05)
-                    
-                    if growth_rate < 0.10:  # Only if growth is reasonable
-                        ddm_value = eps * payout_ratio / (0.10 - growth_rate)
-                        metrics['ddm_value'] = ddm_value
-                        metrics['ddm_premium'] = (ddm_value - eps) / eps if eps > 0 else 0
+                if growth_rate < DISCOUNT_RATE:  # Only if growth is reasonable
+                    ddm_value = eps * payout_ratio / (DISCOUNT_RATE - growth_rate)
+                    metrics['ddm_value'] = ddm_value
+                    metrics['ddm_premium'] = (ddm_value - eps) / eps
             
             # Enterprise Value metrics
-            if 'enterprise_value' in fundamental_data and 'market_cap' in fundamental_data:
-                ev = fundamental_data.get('enterprise_value', 0)
-                market_cap = fundamental_data.get('market_cap', 0)
+            if ev > 0 and market_cap > 0:
+                metrics['ev_to_market_cap'] = ev / market_cap
                 
-                if ev > 0 and market_cap > 0:
-                    metrics['ev_to_market_cap'] = ev / market_cap
-                    
-                    # EV/EBITDA if available
-                    if 'enterprise_to_ebitda' in fundamental_data:
-                        metrics['ev_to_ebitda'] = fundamental_data.get('enterprise_to_ebitda', 0)
+                # EV/EBITDA if available
+                if 'enterprise_to_ebitda' in fundamental_data:
+                    metrics['ev_to_ebitda'] = get('enterprise_to_ebitda', 0)
             
             # Return metrics
-            if 'market_cap' in fundamental_data and 'book_value' in fundamental_data:
-                book_value = fundamental_data.get('book_value', 0)
-                shares = fundamental_data.get('shares_outstanding', 0)
-                
-                if book_value > 0 and shares > 0:
-                    total_book_value = book_value * shares
-                    market_cap = fundamental_data.get('market_cap', 0)
-                    
-                    if market_cap > 0:
-                        metrics['price_to_book'] = market_cap / total_book_value
+            if book_value > 0 and shares > 0 and market_cap > 0:
+                metrics['price_to_book'] = market_cap / (book_value * shares)
             
             return metrics
             
@@ -442,6 +397,8 @@ class FundamentalAnalyzer:
         if not stock_data or not peer_data:
             return {}
         
+        import pandas as pd
+        
         try:
             comparison = {
                 'stock_symbol': stock_data.get('symbol', ''),
@@ -449,48 +406,45 @@ class FundamentalAnalyzer:
                 'rankings': {}
             }
             
-            # Calculate peer averages
-            peer_metrics = {}
-            for peer in peer_data:
-                for key, value in peer.items():
-                    if key not in ['symbol', 'company_name'] and isinstance(value, (int, float)):
-                        if key not in peer_metrics:
-                            peer_metrics[key] = []
-                        peer_metrics[key].append(value)
+            # One numeric column per metric; None becomes NaN and text/date fields are dropped
+            peers = pd.DataFrame.from_records(peer_data).drop(columns=['symbol', 'company_name'], errors='ignore')
+            peers = peers.select_dtypes(include=['number', 'bool']).astype(float).dropna(axis=1, how='all')
+            
+            # The stock's numeric metrics, coerced once; missing metrics count as 0
+            stock_values = {}
+            for metric in peers.columns:
+                stock_value = stock_data.get(metric, 0)
+                if isinstance(stock_value, (int, float)):
+                    stock_values[metric] = stock_value
+            metrics = list(stock_values)
             
             # Calculate averages and compare
-            for metric, values in peer_metrics.items():
-                if values:
-                    avg_value = np.mean(values)
-                    stock_value = stock_data.get(metric, 0)
-                    
-                    if isinstance(stock_value, (int, float)) and avg_value != 0:
-                        comparison['peer_comparison'][metric] = {
-                            'stock_value': stock_value,
-                            'peer_average': avg_value,
-                            'difference': stock_value - avg_value,
-                            'percent_difference': ((stock_value - avg_value) / avg_value) * 100
-                        }
-            
-            # Calculate rankings
-            for metric, values in peer_metrics.items():
-                if values:
-                    stock_value = stock_data.get(metric, 0)
-                    if isinstance(stock_value, (int, float)):
-                        # Sort values (lower is better for some metrics)
-                        sorted_values = sorted(values)
-                        if metric in ['pe_ratio', 'pb_ratio', 'debt_to_equity']:
-                            # Lower is better
-                            rank = sorted_values.index(stock_value) + 1
-                        else:
-                            # Higher is better
-                            rank = len(sorted_values) - sorted_values.index(stock_value)
-                        
-                        comparison['rankings'][metric] = {
-                            'rank': rank,
-                            'total_peers': len(sorted_values),
-                            'percentile': (rank / len(sorted_values)) * 100
-                        }
+            averages = peers[metrics].mean().tolist()
+            for metric, stock_value, avg_value in zip(metrics, stock_values.values(), averages):
+                if avg_value != 0:
+                    comparison['peer_comparison'][metric] = {
+                        'stock_value': stock_value,
+                        'peer_average': avg_value,
+                        'difference': stock_value - avg_value,
+                        'percent_difference': ((stock_value - avg_value) / avg_value) * 100
+                    }
+            
+            # Calculate rankings for every metric in one pass over the raw peer matrix
+            values = peers[metrics].to_numpy()
+            stock = np.array(list(stock_values.values()), dtype=float)
+            totals = np.count_nonzero(~np.isnan(values), axis=0)
+            
+            # Peers strictly below the stock; a value no peer shares still ranks
+            below = np.where(np.isnan(stock), totals, np.count_nonzero(values < stock, axis=0))
+            lower_is_better = np.array([metric in ('pe_ratio', 'pb_ratio', 'debt_to_equity') for metric in metrics], dtype=bool)
+            ranks = np.clip(np.where(lower_is_better, below + 1, totals - below), 1, totals)
+            
+            for metric, rank, total in zip(metrics, ranks.tolist(), totals.tolist()):
+                comparison['rankings'][metric] = {
+                    'rank': rank,
+                    'total_peers': total,
+                    'percentile': (rank / total) * 100
+                }
             
             return comparison
             
@@ -514,20 +468,15 @@ class FundamentalAnalyzer:
                     'opportunities': []
                 },
                 'detailed_analysis': {
-                    'valuation': self._analyze_valuation(fundamental_data, scores),
-                    'profitability': self._analyze_profitability(fundamental_data, scores),
-                    'growth': self._analyze_growth(fundamental_data, scores),
-                    'financial_health': self._analyze_financial_health(fundamental_data, scores)
+                    category: self._analyze(category, fundamental_data, scores)
+                    for category in INSIGHT_RULES
                 },
                 'key_metrics': fundamental_data,
                 'scores': scores
             }
             
-            # Identify strengths and weaknesses
-            report['summary']['strengths'] = self._identify_strengths(scores)
-            report['summary']['weaknesses'] = self._identify_weaknesses(scores)
-            report['summary']['risks'] = self._identify_risks(fundamental_data)
-            report['summary']['opportunities'] = self._identify_opportunities(fundamental_data)
+            # Identify strengths, weaknesses, risks and opportunities
+            report['summary'].update(self._identify_all(scores, fundamental_data))
             
             return report
             
@@ -537,200 +486,65 @@ class FundamentalAnalyzer:
     
     def _get_recommendation(self, overall_score: float) -> str:
         """Get recommendation based on overall score"""
-        if overall_score >= 80:
-            return "Strong Buy"
-        elif overall_score >= 70:
-            return "Buy"
-        elif overall_score >= 60:
-            return "Hold"
-        elif overall_score >= 50:
-            return "Weak Hold"
-        else:
-            return "Sell"
-    
-    def _analyze_valuation(self, data: Dict, scores: Dict) -> Dict:
-        """Analyze valuation metrics"""
-        valuation_score = scores.get('valuation', 0)
-        
-        analysis = {
-            'score': valuation_score,
-            'grade': self._get_grade(valuation_score),
-            'insights': []
-        }
-        
-        # Add specific insights
-        pe_ratio = data.get('pe_ratio', 0)
-        if pe_ratio > 0:
-            if pe_ratio < 15:
-                analysis['insights'].append("P/E ratio indicates excellent value")
-            elif pe_ratio > 30:
-                analysis['insights'].append("P/E ratio suggests overvaluation")
-        
-        pb_ratio = data.get('pb_ratio', 0)
-        if pb_ratio > 0:
-            if pb_ratio < 1:
-                analysis['insights'].append("P/B ratio indicates strong asset value")
-            elif pb_ratio > 3:
-                analysis['insights'].append("P/B ratio suggests premium pricing")
-        
-        return analysis
-    
-    def _analyze_profitability(self, data: Dict, scores: Dict) -> Dict:
-        """Analyze profitability metrics"""
-        profitability_score = scores.get('profitability', 0)
-        
-        analysis = {
-            'score': profitability_score,
-            'grade': self._get_grade(profitability_score),
-            'insights': []
-        }
-        
-        # Add specific insights
-        roe = data.get('roe', 0)
-        if roe > 0.20:
-            analysis['insights'].append("Excellent return on equity")
-        elif roe < 0.05:
-            analysis['insights'].append("Poor return on equity")
-        
-        gross_margin = data.get('gross_margin', 0)
-        if gross_margin > 0.40:
-            analysis['insights'].append("Strong gross margins")
-        elif gross_margin < 0.20:
-            analysis['insights'].append("Weak gross margins")
-        
-        return analysis
-    
-    def _analyze_growth(self, data: Dict, scores: Dict) -> Dict:
-        """Analyze growth metrics"""
-        growth_score = scores.get('growth', 0)
-        
-        analysis = {
-            'score': growth_score,
-            'grade': self._get_grade(growth_score),
-            'insights': []
-        }
-        
-        # Add specific insights
-        revenue_growth = data.get('revenue_growth', 0)
-        if revenue_growth > 0.20:
-            analysis['insights'].append("Strong revenue growth")
-        elif revenue_growth < 0.05:
-            analysis['insights'].append("Weak revenue growth")
-        
-        earnings_growth = data.get('earnings_growth', 0)
-        if earnings_growth > 0.25:
-            analysis['insights'].append("Excellent earnings growth")
-        elif earnings_growth < 0.10:
-            analysis['insights'].append("Poor earnings growth")
-        
-        return analysis
+        return RECOMMENDATIONS[bisect_right(SIGNAL_CUTS, overall_score)]
     
-    def _analyze_financial_health(self, data: Dict, scores: Dict) -> Dict:
-        """Analyze financial health metrics"""
-        financial_health_score = scores.get('financial_health', 0)
-        
-        analysis = {
-            'score': financial_health_score,
-            'grade': self._get_grade(financial_health_score),
-            'insights': []
+    def _analyze(self, category: str, data: Dict, scores: Dict) -> Dict:
+        """Grade one score category and collect insights from its metric rules"""
+        score = scores.get(category, 0)
+        insights = []
+        
+        for metric, positive_only, low, low_msg, high, high_msg in INSIGHT_RULES[category]:
+            value = data.get(metric, 0)
+            if positive_only and not value > 0:
+                continue
+            if value < low:
+                insights.append(low_msg)
+            elif value > high:
+                insights.append(high_msg)
+        
+        return {
+            'score': score,
+            'grade': self._get_grade(score),
+            'insights': insights
         }
-        
-        # Add specific insights
-        debt_to_equity = data.get('debt_to_equity', 0)
-        if debt_to_equity < 0.3:
-            analysis['insights'].append("Low debt levels")
-        elif debt_to_equity > 1.0:
-            analysis['insights'].append("High debt levels")
-        
-        current_ratio = data.get('current_ratio', 0)
-        if current_ratio > 2.0:
-            analysis['insights'].append("Strong liquidity position")
-        elif current_ratio < 1.0:
-            analysis['insights'].append("Weak liquidity position")
-        
-        return analysis
     
     def _get_grade(self, score: float) -> str:
         """Convert score to letter grade"""
-        if score >= 90:
-            return "A+"
-        elif score >= 80:
-            return "A"
-        elif score >= 70:
-            return "B+"
-        elif score >= 60:
-            return "B"
-        elif score >= 50:
-            return "C+"
-        elif score >= 40:
-            return "C"
-        elif score >= 30:
-            return "D"
-        else:
-            return "F"
+        return GRADES[bisect_right(GRADE_CUTS, score)]
     
-    def _identify_strengths(self, scores: Dict) -> List[str]:
-        """Identify company strengths"""
+    def _identify_all(self, scores: Dict, data: Dict) -> Dict[str, List[str]]:
+        """Identify strengths, weaknesses, risks and opportunities in one pass"""
         strengths = []
-        
-        if scores.get('valuation', 0) >= 70:
-            strengths.append("Strong valuation metrics")
-        if scores.get('profitability', 0) >= 70:
-            strengths.append("High profitability")
-        if scores.get('growth', 0) >= 70:
-            strengths.append("Strong growth trajectory")
-        if scores.get('financial_health', 0) >= 70:
-            strengths.append("Solid financial health")
-        
-        return strengths
-    
-    def _identify_weaknesses(self, scores: Dict) -> List[str]:
-        """Identify company weaknesses"""
         weaknesses = []
         
-        if scores.get('valuation', 0) < 50:
-            weaknesses.append("Poor valuation metrics")
-        if scores.get('profitability', 0) < 50:
-            weaknesses.append("Low profitability")
-        if scores.get('growth', 0) < 50:
-            weaknesses.append("Weak growth")
-        if scores.get('financial_health', 0) < 50:
-            weaknesses.append("Poor financial health")
+        for category, strength, weakness in SUMMARY_LABELS:
+            score = scores.get(category, 0)
+            if score >= 70:
+                strengths.append(strength)
+            elif score < 50:
+                weaknesses.append(weakness)
         
-        return weaknesses
-    
-    def _identify_risks(self, data: Dict) -> List[str]:
-        """Identify potential risks"""
-        risks = []
+        pe_ratio = data.get('pe_ratio', 0)
         
-        debt_to_equity = data.get('debt_to_equity', 0)
-        if debt_to_equity > 1.0:
+        risks = []
+        if data.get('debt_to_equity', 0) > 1.0:
             risks.append("High debt levels")
-        
-        pe_ratio = data.get('pe_ratio', 0)
         if pe_ratio > 30:
             risks.append("High valuation multiples")
-        
-        beta = data.get('beta', 0)
-        if beta > 1.5:
+        if data.get('beta', 0) > 1.5:
             risks.append("High market volatility")
         
-        return risks
-    
-    def _identify_opportunities(self, data: Dict) -> List[str]:
-        """Identify potential opportunities"""
         opportunities = []
-        
-        pe_ratio = data.get('pe_ratio', 0)
         if pe_ratio < 15:
             opportunities.append("Undervalued based on P/E ratio")
-        
-        revenue_growth = data.get('revenue_growth', 0)
-        if revenue_growth > 0.15:
+        if data.get('revenue_growth', 0) > 0.15:
             opportunities.append("Strong revenue growth potential")
-        
-        market_cap = data.get('market_cap', 0)
-        if market_cap < 10000000000:  # $10B
+        if data.get('market_cap', 0) < 10000000000:  # $10B
             opportunities.append("Mid-cap growth potential")
         
-        return opportunities
+        return {
+            'strengths': strengths,
+            'weaknesses': weaknesses,
+            'risks': risks,
+            'opportunities': opportunities
+        }
@@ -0,0 +1,330 @@
+import numpy as np
+from _njit import njit, NUMBA_AVAILABLE
+
+# Kernels mirror the pandas semantics used elsewhere (min_periods=window, adjusted EWM,
+# sample std) so results match the non-JIT path. fastmath is left off because it lets
+# LLVM assume no NaNs, which would break the warm-up and missing-data handling.
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def rolling_mean(values, window):
+    """Rolling mean; NaN until a full window of non-NaN values is available"""
+    n = len(values)
+    out = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        total = 0.0
+        for j in range(i - window + 1, i + 1):
+            total += values[j]
+        # NaN propagates through the sum, matching pandas for windows with gaps
+        out[i] = total / window
+    return out
+
+@njit(cache=True, nogil=True)
+def _compensated_add(total, compensation, value):
+    """Neumaier summation step; returns the new total and compensation"""
+    new_total = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - new_total) + value
+    else:
+        compensation += (value - new_total) + total
+    return new_total, compensation
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def rolling_means(values, windows):
+    """Rolling means for several window lengths in one pass; row k is the mean over windows[k]"""
+    n = len(values)
+    count = len(windows)
+    out = np.full((count, n), np.nan)
+    totals = np.zeros(count)
+    compensations = np.zeros(count)
+    missing = np.zeros(count, dtype=np.int64)
+    
+    for i in range(n):
+        entering = values[i]
+        for k in range(count):
+            window = windows[k]
+            # Running sum: add the entering value, drop the one leaving the window
+            if entering == entering:
+                totals[k], compensations[k] = _compensated_add(totals[k], compensations[k], entering)
+            else:
+                missing[k] += 1
+            if i >= window:
+                leaving = values[i - window]
+                if leaving == leaving:
+                    totals[k], compensations[k] = _compensated_add(totals[k], compensations[k], -leaving)
+                else:
+                    missing[k] -= 1
+            # Like pandas (min_periods=window), any NaN in the window gives NaN
+            if i >= window - 1 and missing[k] == 0:
+                out[k, i] = (totals[k] + compensations[k]) / window
+    return out
+
+def rolling_wma(values, window):
+    """Linearly weighted rolling mean (weights 1..window, newest heaviest)"""
+    # Plain NumPy rather than a kernel: one matrix-vector product over strided windows is
+    # already vectorized, so it stays fast without numba too
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        weights = np.arange(1, window + 1, dtype=np.float64)
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        out[window - 1:] = windows @ (weights / weights.sum())
+    return out
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def rolling_mean_std(values, window):
+    """Rolling mean and sample standard deviation (ddof=1) in one pass"""
+    n = len(values)
+    means = np.full(n, np.nan)
+    stds = np.full(n, np.nan)
+    count = 0
+    missing = 0
+    mean = 0.0
+    ssqdm = 0.0
+    same_run = 0
+    
+    for i in range(n):
+        # Sliding Welford update, as in pandas' roll_var: add the entering value, remove the leaving one
+        entering = values[i]
+        same_run = same_run + 1 if i > 0 and entering == values[i - 1] else 1
+        if entering == entering:
+            count += 1
+            delta = entering - mean
+            mean += delta / count
+            ssqdm += (count - 1) * delta * delta / count
+        else:
+            missing += 1
+        if i >= window:
+            leaving = values[i - window]
+            if leaving == leaving:
+                count -= 1
+                if count > 0:
+                    delta = leaving - mean
+                    mean -= delta / count
+                    ssqdm -= (count + 1) * delta * delta / count
+                else:
+                    mean = 0.0
+                    ssqdm = 0.0
+            else:
+                missing -= 1
+        if i >= window - 1 and missing == 0:
+            if same_run >= window:
+                # Flat window: report it exactly rather than with the update's rounding residue
+                means[i] = entering
+                if window > 1:
+                    stds[i] = 0.0
+            else:
+                means[i] = mean
+                if window > 1:
+                    stds[i] = np.sqrt(max(ssqdm, 0.0) / (window - 1))
+    return means, stds
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def ewmas(values, spans):
+    """Exponentially weighted means for several spans in one pass; row k equals Series.ewm(span=spans[k]).mean()"""
+    n = len(values)
+    count = len(spans)
+    out = np.full((count, n), np.nan)
+    if n == 0:
+        return out
+    
+    old_wt_factors = 1.0 - 2.0 / (spans + 1.0)
+    weighted = np.full(count, values[0])
+    old_wts = np.ones(count)
+    
+    for i in range(n):
+        cur = values[i]
+        is_obs = cur == cur
+        for k in range(count):
+            if i > 0:
+                if weighted[k] == weighted[k]:
+                    # Weights keep decaying across missing values (ignore_na=False)
+                    old_wts[k] *= old_wt_factors[k]
+                    if is_obs:
+                        if weighted[k] != cur:
+                            weighted[k] = (old_wts[k] * weighted[k] + cur) / (old_wts[k] + 1.0)
+                        old_wts[k] += 1.0
+                elif is_obs:
+                    weighted[k] = cur
+            out[k, i] = weighted[k]
+    return out
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def ewma(values, span):
+    """Exponentially weighted mean, equivalent to Series.ewm(span=span).mean()"""
+    return ewmas(values, np.array([float(span)]))[0]
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def rsi(close, period):
+    """Relative Strength Index from simple rolling averages of gains and losses"""
+    n = len(close)
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+    
+    avg_gain = rolling_mean(gains, period)
+    avg_loss = rolling_mean(losses, period)
+    return 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def obv_vwap(close, volume):
+    """On-Balance Volume and cumulative VWAP in one pass over closes and volumes"""
+    n = len(close)
+    obv = np.empty(n)
+    vwap = np.empty(n)
+    obv_total = 0.0
+    price_volume_total = 0.0
+    volume_total = 0.0
+    
+    for i in range(n):
+        cur = close[i]
+        vol = volume[i]
+        # Volume is added on an up close and subtracted on a down close; gaps add nothing
+        if i > 0 and vol == vol:
+            if cur > close[i - 1]:
+                obv_total += vol
+            elif cur < close[i - 1]:
+                obv_total -= vol
+        obv[i] = obv_total
+        
+        # Like pandas' cumsum, a missing value blanks its own row but doesn't stop the running totals
+        price_volume = cur * vol
+        if vol == vol:
+            volume_total += vol
+        if price_volume == price_volume and vol == vol:
+            price_volume_total += price_volume
+            vwap[i] = price_volume_total / volume_total
+        else:
+            vwap[i] = np.nan
+    return obv, vwap
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def mfi(typical_price, volume, period):
+    """Money Flow Index from rolling sums of positive and negative money flow"""
+    n = len(typical_price)
+    out = np.full(n, np.nan)
+    # Flows of the last period bars, slot i % period
+    positive_ring = np.zeros(period)
+    negative_ring = np.zeros(period)
+    positive_total = positive_compensation = 0.0
+    negative_total = negative_compensation = 0.0
+    positive_run = negative_run = 0
+    missing = 0
+    prev_tp = np.nan
+    
+    for i in range(n):
+        tp = typical_price[i]
+        flow = tp * volume[i]
+        # Flow counts as positive on a higher typical price, negative on a lower one, else zero
+        positive = flow if tp > prev_tp else 0.0
+        negative = flow if tp < prev_tp else 0.0
+        prev_tp = tp
+        
+        slot = i % period
+        last = (i - 1) % period
+        positive_run = positive_run + 1 if i > 0 and positive == positive_ring[last] else 1
+        negative_run = negative_run + 1 if i > 0 and negative == negative_ring[last] else 1
+        
+        # A missing volume makes the side that kept the flow NaN; it is counted, not summed
+        if positive == positive:
+            positive_total, positive_compensation = _compensated_add(positive_total, positive_compensation, positive)
+        else:
+            missing += 1
+        if negative == negative:
+            negative_total, negative_compensation = _compensated_add(negative_total, negative_compensation, negative)
+        else:
+            missing += 1
+        if i >= period:
+            leaving = positive_ring[slot]
+            if leaving == leaving:
+                positive_total, positive_compensation = _compensated_add(positive_total, positive_compensation, -leaving)
+            else:
+                missing -= 1
+            leaving = negative_ring[slot]
+            if leaving == leaving:
+                negative_total, negative_compensation = _compensated_add(negative_total, negative_compensation, -leaving)
+            else:
+                missing -= 1
+        positive_ring[slot] = positive
+        negative_ring[slot] = negative
+        
+        if i >= period - 1 and missing == 0:
+            # Like pandas' rolling sum, a window of one repeated flow (typically zero) sums exactly
+            positive_sum = positive * period if positive_run >= period else positive_total + positive_compensation
+            negative_sum = negative * period if negative_run >= period else negative_total + negative_compensation
+            out[i] = 100.0 - (100.0 / (1.0 + positive_sum / negative_sum))
+    return out
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def cci(typical_price, period):
+    """Commodity Channel Index; the deviation is averaged over the last period bars, each from its own rolling mean"""
+    n = len(typical_price)
+    out = np.full(n, np.nan)
+    # Deviations of the last period bars, slot i % period
+    deviation_ring = np.zeros(period)
+    price_total = price_compensation = 0.0
+    deviation_total = deviation_compensation = 0.0
+    price_run = deviation_run = 0
+    price_missing = deviation_missing = 0
+    
+    for i in range(n):
+        price = typical_price[i]
+        price_run = price_run + 1 if i > 0 and price == typical_price[i - 1] else 1
+        if price == price:
+            price_total, price_compensation = _compensated_add(price_total, price_compensation, price)
+        else:
+            price_missing += 1
+        if i >= period:
+            leaving = typical_price[i - period]
+            if leaving == leaving:
+                price_total, price_compensation = _compensated_add(price_total, price_compensation, -leaving)
+            else:
+                price_missing -= 1
+        
+        # Rolling mean of the typical price, then this bar's absolute deviation from it
+        mean = np.nan
+        if i >= period - 1 and price_missing == 0:
+            mean = price if price_run >= period else (price_total + price_compensation) / period
+        deviation = abs(price - mean)
+        
+        # Rolling mean of the deviations; any bar without one (warm-up or gaps) blanks the window
+        slot = i % period
+        deviation_run = deviation_run + 1 if i > 0 and deviation == deviation_ring[(i - 1) % period] else 1
+        if deviation == deviation:
+            deviation_total, deviation_compensation = _compensated_add(deviation_total, deviation_compensation, deviation)
+        else:
+            deviation_missing += 1
+        if i >= period:
+            leaving = deviation_ring[slot]
+            if leaving == leaving:
+                deviation_total, deviation_compensation = _compensated_add(deviation_total, deviation_compensation, -leaving)
+            else:
+                deviation_missing -= 1
+        deviation_ring[slot] = deviation
+        
+        if i >= period - 1 and deviation_missing == 0:
+            # Like pandas' rolling mean: flat windows are exact and a mean of non-negative values never goes below zero
+            if deviation_run >= period:
+                mean_deviation = deviation
+            else:
+                mean_deviation = max((deviation_total + deviation_compensation) / period, 0.0)
+            out[i] = (price - mean) / (0.015 * mean_deviation)
+    return out
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def macd(close, fast, slow, signal):
+    """MACD line, signal line and histogram"""
+    fast_ema, slow_ema = ewmas(close, np.array([float(fast), float(slow)]))
+    macd_line = fast_ema - slow_ema
+    signal_line = ewma(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def bollinger(close, period, n_std):
+    """Upper, middle and lower Bollinger Bands"""
+    middle, std = rolling_mean_std(close, period)
+    width = std * n_std
+    return middle + width, middle, middle - width
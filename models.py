@@ -1,10 +1,51 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, DateTime, Boolean, Text, ForeignKey, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
+from enum import IntEnum
 
 Base = declarative_base()
 
+class SignalType(IntEnum):
+    """Trading signal; same codes as the signal combiner in main.py"""
+    SELL = 0
+    HOLD = 1
+    BUY = 2
+
+class AlertType(IntEnum):
+    """What an alert watches"""
+    PRICE = 0
+    VOLUME = 1
+    TECHNICAL = 2
+    FUNDAMENTAL = 3
+
+class AlertCondition(IntEnum):
+    """How an alert compares against its threshold"""
+    ABOVE = 0
+    BELOW = 1
+    CROSSES = 2
+
+class IntEnumType(TypeDecorator):
+    """Store an IntEnum as a small integer; member names ('buy') are accepted on write and legacy string rows on read"""
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+    
+    def _to_enum(self, value):
+        if isinstance(value, str) and not value.isdigit():
+            return self.enum_class[value.upper()]
+        return self.enum_class(int(value))
+    
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int(self._to_enum(value))
+    
+    def process_result_value(self, value, dialect):
+        return None if value is None else self._to_enum(value)
+
 class Stock(Base):
     __tablename__ = "stocks"
     
@@ -42,8 +83,8 @@ class PortfolioPosition(Base):
     __tablename__ = "portfolio_positions"
     
     id = Column(Integer, primary_key=True, index=True)
-    portfolio_id = Column(Integer, ForeignKey("portfolios.id"))
-    stock_id = Column(Integer, ForeignKey("stocks.id"))
+    portfolio_id = Column(Integer, ForeignKey("portfolios.id"), index=True)
+    stock_id = Column(Integer, ForeignKey("stocks.id"), index=True)
     shares = Column(Float)
     avg_price = Column(Float)
     entry_date = Column(DateTime, default=datetime.utcnow)
@@ -56,8 +97,8 @@ class TechnicalSignal(Base):
     __tablename__ = "technical_signals"
     
     id = Column(Integer, primary_key=True, index=True)
-    stock_id = Column(Integer, ForeignKey("stocks.id"))
-    signal_type = Column(String)  # 'buy', 'sell', 'hold'
+    stock_id = Column(Integer, ForeignKey("stocks.id"), index=True)
+    signal_type = Column(IntEnumType(SignalType), index=True)
     confidence = Column(Float)
     indicators = Column(JSON)  # Store indicator values
     pattern_detected = Column(String)
@@ -70,7 +111,7 @@ class FundamentalScore(Base):
     __tablename__ = "fundamental_scores"
     
     id = Column(Integer, primary_key=True, index=True)
-    stock_id = Column(Integer, ForeignKey("stocks.id"))
+    stock_id = Column(Integer, ForeignKey("stocks.id"), index=True)
     overall_score = Column(Float)
     valuation_score = Column(Float)
     profitability_score = Column(Float)
@@ -86,7 +127,7 @@ class PricePrediction(Base):
     __tablename__ = "price_predictions"
     
     id = Column(Integer, primary_key=True, index=True)
-    stock_id = Column(Integer, ForeignKey("stocks.id"))
+    stock_id = Column(Integer, ForeignKey("stocks.id"), index=True)
     predicted_price = Column(Float)
     confidence_interval = Column(JSON)  # Store min, max, confidence
     prediction_date = Column(DateTime)
@@ -99,6 +140,8 @@ class PricePrediction(Base):
 
 class MarketData(Base):
     __tablename__ = "market_data"
+    # Per-stock time series lookups; also serves plain stock_id filters
+    __table_args__ = (Index("ix_market_data_stock_id_date", "stock_id", "date"),)
     
     id = Column(Integer, primary_key=True, index=True)
     stock_id = Column(Integer, ForeignKey("stocks.id"))
@@ -133,11 +176,13 @@ class MarketData(Base):
 
 class Alert(Base):
     __tablename__ = "alerts"
+    # Active alerts for a stock; also serves plain stock_id filters
+    __table_args__ = (Index("ix_alerts_stock_id_is_active", "stock_id", "is_active"),)
     
     id = Column(Integer, primary_key=True, index=True)
     stock_id = Column(Integer, ForeignKey("stocks.id"))
-    alert_type = Column(String)  # 'price', 'volume', 'technical', 'fundamental'
-    condition = Column(String)  # 'above', 'below', 'crosses'
+    alert_type = Column(IntEnumType(AlertType))
+    condition = Column(IntEnumType(AlertCondition))
     threshold = Column(Float)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
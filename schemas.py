@@ -0,0 +1,48 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+# Response models for the endpoints that return plain dicts. FastAPI serializes these
+# through pydantic's compiled serializer instead of walking the dict with jsonable_encoder.
+# The analysis endpoints return AnalysisResponse directly and don't need them.
+
+class PortfolioSummary(BaseModel):
+    """Portfolio as listed by /api/portfolios"""
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+class PortfolioList(BaseModel):
+    """All portfolios"""
+    portfolios: List[PortfolioSummary]
+
+class PortfolioCreated(BaseModel):
+    """Result of creating a portfolio"""
+    message: str
+    portfolio_id: int
+
+class PositionValuation(BaseModel):
+    """A portfolio position valued at its current price"""
+    symbol: str
+    company_name: Optional[str] = None
+    shares: float
+    avg_price: float
+    current_price: float
+    position_value: float
+    unrealized_pnl: float
+
+class PortfolioDetail(BaseModel):
+    """Portfolio with its valued positions"""
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    total_value: float
+    positions: List[PositionValuation]
+
+class PortfolioDetailResponse(BaseModel):
+    """Response body of /api/portfolios/{portfolio_id}"""
+    portfolio: PortfolioDetail
+
+class HealthStatus(BaseModel):
+    """Health check result"""
+    status: str
+    service: str
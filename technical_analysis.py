@@ -1,3 +1,4 @@
+import math
 import pandas as pd
 import numpy as np
 # import talib  # Commented out - requires special installation
@@ -8,21 +9,125 @@ except ImportError:
     TALIB_AVAILABLE = False
     print("Warning: talib not available. Using alternative technical analysis methods.")
 from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from config import Config
+import indicators
+from config import CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Simple moving average windows, one SMA_<window> column each
+SMA_WINDOWS = (5, 10, 20, 50, 100, 200)
+
+# Exponential moving average spans, one EMA_<span> column each
+EMA_SPANS = (12, 26, 50, 200)
+
+# Bar offsets of the 20-bar triangle window, centred on zero, and their sum of squares;
+# the least-squares slope of prices y over the window is TREND_OFFSETS @ (y - y.mean()) / TREND_SUM_SQUARES
+TREND_OFFSETS = np.arange(20) - 9.5
+TREND_SUM_SQUARES = float(TREND_OFFSETS @ TREND_OFFSETS)
+
+# Weight of each individual signal in the combined signal
+SIGNAL_WEIGHTS = {
+    'RSI': 0.2,
+    'MACD': 0.25,
+    'Bollinger_Bands': 0.2,
+    'Moving_Averages': 0.25,
+    'Volume': 0.1
+}
+
+# Score multiplier for each signal direction in the combined signal; other signals score zero
+SIGNAL_DIRECTIONS = {'buy': 1, 'sell': -1}
+
+# Columns read by the signal generators, and their positions in the generate_signals row snapshot
+SIGNAL_COLUMNS = (
+    'Close', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Histogram', 'BB_Upper', 'BB_Lower',
+    'BB_Position', 'SMA_20', 'SMA_50', 'SMA_200', 'Volume', 'OBV'
+)
+(COL_CLOSE, COL_RSI, COL_MACD, COL_MACD_SIGNAL, COL_MACD_HISTOGRAM, COL_BB_UPPER, COL_BB_LOWER,
+ COL_BB_POSITION, COL_SMA_20, COL_SMA_50, COL_SMA_200, COL_VOLUME, COL_OBV) = range(len(SIGNAL_COLUMNS))
+
+# TA-Lib candlestick pattern functions and their display names
+CANDLESTICK_PATTERNS = {
+    'CDL2CROWS': 'Two Crows',
+    'CDL3BLACKCROWS': 'Three Black Crows',
+    'CDL3INSIDE': 'Three Inside Up/Down',
+    'CDL3LINESTRIKE': 'Three-Line Strike',
+    'CDL3OUTSIDE': 'Three Outside Up/Down',
+    'CDL3STARSINSOUTH': 'Three Stars In The South',
+    'CDL3WHITESOLDIERS': 'Three White Soldiers',
+    'CDLABANDONEDBABY': 'Abandoned Baby',
+    'CDLADVANCEBLOCK': 'Advance Block',
+    'CDLBELTHOLD': 'Belt-hold',
+    'CDLBREAKAWAY': 'Breakaway',
+    'CDLDARKCLOUDCOVER': 'Dark Cloud Cover',
+    'CDLDOJI': 'Doji',
+    'CDLDOJISTAR': 'Doji Star',
+    'CDLDRAGONFLYDOJI': 'Dragonfly Doji',
+    'CDLENGULFING': 'Engulfing Pattern',
+    'CDLEVENINGDOJISTAR': 'Evening Doji Star',
+    'CDLEVENINGSTAR': 'Evening Star',
+    'CDLGAPSIDESIDEWHITE': 'Up/Down-gap side-by-side white lines',
+    'CDLGRAVESTONEDOJI': 'Gravestone Doji',
+    'CDLHAMMER': 'Hammer',
+    'CDLHANGINGMAN': 'Hanging Man',
+    'CDLHARAMI': 'Harami Pattern',
+    'CDLHARAMICROSS': 'Harami Cross Pattern',
+    'CDLHIGHWAVE': 'High-Wave Candle',
+    'CDLHIKKAKE': 'Hikkake Pattern',
+    'CDLHIKKAKEMOD': 'Modified Hikkake Pattern',
+    'CDLHOMINGPIGEON': 'Homing Pigeon',
+    'CDLIDENTICAL3CROWS': 'Identical Three Crows',
+    'CDLINNECK': 'In-Neck Pattern',
+    'CDLINVERTEDHAMMER': 'Inverted Hammer',
+    'CDLKICKING': 'Kicking',
+    'CDLKICKINGBYLENGTH': 'Kicking - bull/bear determined by the longer marubozu',
+    'CDLLADDERBOTTOM': 'Ladder Bottom',
+    'CDLLONGLEGGEDDOJI': 'Long Legged Doji',
+    'CDLLONGLINE': 'Long Line Candle',
+    'CDLMARUBOZU': 'Marubozu',
+    'CDLMATCHINGLOW': 'Matching Low',
+    'CDLMATHOLD': 'Mat Hold',
+    'CDLMORNINGDOJISTAR': 'Morning Doji Star',
+    'CDLMORNINGSTAR': 'Morning Star',
+    'CDLONNECK': 'On-Neck Pattern',
+    'CDLPIERCING': 'Piercing Pattern',
+    'CDLRICKSHAWMAN': 'Rickshaw Man',
+    'CDLRISEFALL3METHODS': 'Rising/Falling Three Methods',
+    'CDLSEPARATINGLINES': 'Separating Lines',
+    'CDLSHOOTINGSTAR': 'Shooting Star',
+    'CDLSHORTLINE': 'Short Line Candle',
+    'CDLSPINNINGTOP': 'Spinning Top',
+    'CDLSTALLEDPATTERN': 'Stalled Pattern',
+    'CDLSTICKSANDWICH': 'Stick Sandwich',
+    'CDLTAKURI': 'Takuri (Dragonfly Doji with very long lower shadow)',
+    'CDLTASUKIGAP': 'Tasuki Gap',
+    'CDLTHRUSTING': 'Thrusting Pattern',
+    'CDLTRISTAR': 'Tristar Pattern',
+    'CDLUNIQUE3RIVER': 'Unique 3 River',
+    'CDLUPSIDEGAP2CROWS': 'Upside Gap Two Crows',
+    'CDLXSIDEGAP3METHODS': 'Upside/Downside Gap Three Methods'
+}
+
+# TA-Lib pattern functions resolved once, as (name, function) pairs; empty without TA-Lib
+CANDLESTICK_FUNCTIONS = [
+    (pattern_name, getattr(talib, pattern_func))
+    for pattern_func, pattern_name in CANDLESTICK_PATTERNS.items()
+    if TALIB_AVAILABLE and hasattr(talib, pattern_func)
+]
+
 class TechnicalAnalyzer:
     """Comprehensive technical analysis for stocks"""
     
-    def __init__(self):
-        self.rsi_period = Config.RSI_PERIOD
-        self.macd_fast = Config.MACD_FAST
-        self.macd_slow = Config.MACD_SLOW
-        self.macd_signal = Config.MACD_SIGNAL
-        self.bollinger_period = Config.BOLLINGER_PERIOD
-        self.bollinger_std = Config.BOLLINGER_STD
+    def __init__(self, precision: str = 'float64'):
+        # dtype of the derived indicator columns; 'float32' halves their memory, the math stays float64
+        self.precision = np.dtype(precision)
+        self.rsi_period = CONFIG.RSI_PERIOD
+        self.macd_fast = CONFIG.MACD_FAST
+        self.macd_slow = CONFIG.MACD_SLOW
+        self.macd_signal = CONFIG.MACD_SIGNAL
+        self.bollinger_period = CONFIG.BOLLINGER_PERIOD
+        self.bollinger_std = CONFIG.BOLLINGER_STD
     
     def calculate_all_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate all technical indicators for the dataset"""
@@ -37,6 +142,12 @@ class TechnicalAnalyzer:
                     logger.error(f"Missing required column: {col}")
                     return data
             
+            input_columns = data.columns
+            
+            # Typical price, shared by MFI and CCI
+            high, low, close = self._hlc(data)
+            typical_price = (high + low + close) / 3
+            
             # Calculate basic indicators
             data = self._calculate_moving_averages(data)
             data = self._calculate_rsi(data)
@@ -45,36 +156,70 @@ class TechnicalAnalyzer:
             data = self._calculate_stochastic(data)
             data = self._calculate_williams_r(data)
             data = self._calculate_atr(data)
-            data = self._calculate_volume_indicators(data)
-            data = self._calculate_momentum_indicators(data)
+            data = self._calculate_volume_indicators(data, typical_price)
+            data = self._calculate_momentum_indicators(data, typical_price)
             data = self._calculate_trend_indicators(data)
             
+            if self.precision != np.float64:
+                # Store derived indicators at the requested precision; the input prices keep their dtype
+                derived = [col for col in data.columns if col not in input_columns and data[col].dtype == np.float64]
+                data[derived] = data[derived].astype(self.precision)
+            
             return data
             
         except Exception as e:
             logger.error(f"Error calculating indicators: {str(e)}")
             return data
     
+    def calculate_many(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """Calculate all indicators for several symbols' frames in parallel"""
+        # The indicator kernels release the GIL, so symbols really do run side by side on separate cores
+        with ThreadPoolExecutor(max_workers=CONFIG.INDICATOR_WORKERS) as executor:
+            return dict(zip(frames, executor.map(self.calculate_all_indicators, frames.values())))
+    
+    def warm_up(self) -> None:
+        """Run the indicator pipeline once on synthetic prices so the first request doesn't load or compile kernels"""
+        if not indicators.NUMBA_AVAILABLE:
+            return
+        
+        # A random walk long enough for every window (SMA 200), so every kernel runs with its production argument types
+        close = 100 + np.random.default_rng(0).standard_normal(250).cumsum()
+        data = pd.DataFrame({
+            'Open': close,
+            'High': close + 1,
+            'Low': close - 1,
+            'Close': close,
+            'Volume': np.full(250, 1e6)
+        }, index=pd.date_range('2000-01-03', periods=250, freq='B'))
+        self.generate_signals(self.calculate_all_indicators(data))
+    
+    def _hlc(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """High, low and close as float64 arrays, the input TA-Lib's C functions expect"""
+        return tuple(data[col].to_numpy(dtype=np.float64) for col in ('High', 'Low', 'Close'))
+    
     def _calculate_moving_averages(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate various moving averages"""
         try:
-            # Simple Moving Averages
-            data['SMA_5'] = data['Close'].rolling(window=5).mean()
-            data['SMA_10'] = data['Close'].rolling(window=10).mean()
-            data['SMA_20'] = data['Close'].rolling(window=20).mean()
-            data['SMA_50'] = data['Close'].rolling(window=50).mean()
-            data['SMA_100'] = data['Close'].rolling(window=100).mean()
-            data['SMA_200'] = data['Close'].rolling(window=200).mean()
-            
-            # Exponential Moving Averages
-            data['EMA_12'] = data['Close'].ewm(span=12).mean()
-            data['EMA_26'] = data['Close'].ewm(span=26).mean()
-            data['EMA_50'] = data['Close'].ewm(span=50).mean()
-            data['EMA_200'] = data['Close'].ewm(span=200).mean()
-            
-            # Weighted Moving Average (simplified)
-            data['WMA_20'] = data['Close'].rolling(window=20).apply(
-                lambda x: np.average(x, weights=np.arange(1, len(x) + 1)))
+            close = data['Close'].to_numpy(dtype=np.float64)
+            
+            # Simple Moving Averages; windows longer than the history would be all NaN, so they aren't computed
+            windows = [window for window in SMA_WINDOWS if window <= len(close)]
+            if TALIB_AVAILABLE:
+                smas = {window: talib.SMA(close, timeperiod=window) for window in windows}
+            elif windows:
+                # All windows in one running-sum pass over the closes
+                smas = dict(zip(windows, indicators.rolling_means(close, np.array(windows))))
+            else:
+                smas = {}
+            for window in SMA_WINDOWS:
+                data[f'SMA_{window}'] = smas.get(window, np.nan)
+            
+            # Exponential Moving Averages; TA-Lib seeds its EMA differently, so always use the pandas-equivalent kernel
+            for span, ema in zip(EMA_SPANS, indicators.ewmas(close, np.array(EMA_SPANS, dtype=np.float64))):
+                data[f'EMA_{span}'] = ema
+            
+            # Weighted Moving Average (linear weights, newest heaviest)
+            data['WMA_20'] = talib.WMA(close, timeperiod=20) if TALIB_AVAILABLE else indicators.rolling_wma(close, 20)
             
         except Exception as e:
             logger.error(f"Error calculating moving averages: {str(e)}")
@@ -84,15 +229,13 @@ class TechnicalAnalyzer:
     def _calculate_rsi(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate RSI indicator"""
         try:
+            close = data['Close'].to_numpy(dtype=np.float64)
+            
             if TALIB_AVAILABLE:
-                data['RSI'] = talib.RSI(data['Close'], timeperiod=self.rsi_period)
+                data['RSI'] = talib.RSI(close, timeperiod=self.rsi_period)
             else:
                 # Manual RSI calculation
-                delta = data['Close'].diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=self.rsi_period).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=self.rsi_period).mean()
-                rs = gain / loss
-                data['RSI'] = 100 - (100 / (1 + rs))
+                data['RSI'] = indicators.rsi(close, self.rsi_period)
             
             data['RSI_Overbought'] = 70
             data['RSI_Oversold'] = 30
@@ -104,20 +247,20 @@ class TechnicalAnalyzer:
     def _calculate_macd(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate MACD indicator"""
         try:
+            close = data['Close'].to_numpy(dtype=np.float64)
+            
             if TALIB_AVAILABLE:
                 macd, macd_signal, macd_hist = talib.MACD(
-                    data['Close'], 
+                    close, 
                     fastperiod=self.macd_fast, 
                     slowperiod=self.macd_slow, 
                     signalperiod=self.macd_signal
                 )
             else:
                 # Manual MACD calculation
-                ema_fast = data['Close'].ewm(span=self.macd_fast).mean()
-                ema_slow = data['Close'].ewm(span=self.macd_slow).mean()
-                macd = ema_fast - ema_slow
-                macd_signal = macd.ewm(span=self.macd_signal).mean()
-                macd_hist = macd - macd_signal
+                macd, macd_signal, macd_hist = indicators.macd(
+                    close, self.macd_fast, self.macd_slow, self.macd_signal
+                )
             
             data['MACD'] = macd
             data['MACD_Signal'] = macd_signal
@@ -131,19 +274,20 @@ class TechnicalAnalyzer:
     def _calculate_bollinger_bands(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate Bollinger Bands"""
         try:
+            close = data['Close'].to_numpy(dtype=np.float64)
+            
             if TALIB_AVAILABLE:
                 upper, middle, lower = talib.BBANDS(
-                    data['Close'], 
+                    close, 
                     timeperiod=self.bollinger_period, 
                     nbdevup=self.bollinger_std, 
                     nbdevdn=self.bollinger_std
                 )
             else:
                 # Manual Bollinger Bands calculation
-                middle = data['Close'].rolling(window=self.bollinger_period).mean()
-                std = data['Close'].rolling(window=self.bollinger_period).std()
-                upper = middle + (std * self.bollinger_std)
-                lower = middle - (std * self.bollinger_std)
+                upper, middle, lower = indicators.bollinger(
+                    close, self.bollinger_period, self.bollinger_std
+                )
             
             data['BB_Upper'] = upper
             data['BB_Middle'] = middle
@@ -161,7 +305,7 @@ class TechnicalAnalyzer:
         try:
             if TALIB_AVAILABLE:
                 slowk, slowd = talib.STOCH(
-                    data['High'], data['Low'], data['Close'],
+                    *self._hlc(data),
                     fastk_period=14, slowk_period=3, slowd_period=3
                 )
             else:
@@ -183,7 +327,7 @@ class TechnicalAnalyzer:
         """Calculate Williams %R"""
         try:
             if TALIB_AVAILABLE:
-                data['Williams_R'] = talib.WILLR(data['High'], data['Low'], data['Close'], timeperiod=14)
+                data['Williams_R'] = talib.WILLR(*self._hlc(data), timeperiod=14)
             else:
                 # Manual Williams %R calculation
                 high_max = data['High'].rolling(window=14).max()
@@ -198,46 +342,40 @@ class TechnicalAnalyzer:
     def _calculate_atr(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate Average True Range"""
         try:
+            high, low, close = self._hlc(data)
+            
             if TALIB_AVAILABLE:
-                data['ATR'] = talib.ATR(data['High'], data['Low'], data['Close'], timeperiod=14)
+                data['ATR'] = talib.ATR(high, low, close, timeperiod=14)
             else:
-                # Manual ATR calculation
-                high_low = data['High'] - data['Low']
-                high_close = np.abs(data['High'] - data['Close'].shift())
-                low_close = np.abs(data['Low'] - data['Close'].shift())
-                true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-                data['ATR'] = true_range.rolling(window=14).mean()
+                # Manual ATR calculation; the first bar has no previous close, so its true range is NaN
+                prev_close = np.empty_like(close)
+                prev_close[0] = np.nan
+                prev_close[1:] = close[:-1]
+                true_range = np.maximum.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+                data['ATR'] = indicators.rolling_means(true_range, np.array([14]))[0]
             
         except Exception as e:
             logger.error(f"Error calculating ATR: {str(e)}")
         
         return data
     
-    def _calculate_volume_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_volume_indicators(self, data: pd.DataFrame, typical_price: np.ndarray) -> pd.DataFrame:
         """Calculate volume-based indicators"""
         try:
-            # On-Balance Volume (OBV)
-            data['OBV'] = (np.sign(data['Close'].diff()) * data['Volume']).fillna(0).cumsum()
+            volume = data['Volume'].to_numpy(dtype=np.float64)
             
-            # Volume Weighted Average Price (VWAP)
-            data['VWAP'] = (data['Close'] * data['Volume']).cumsum() / data['Volume'].cumsum()
+            # On-Balance Volume (OBV) and Volume Weighted Average Price (VWAP)
+            data['OBV'], data['VWAP'] = indicators.obv_vwap(data['Close'].to_numpy(dtype=np.float64), volume)
             
             # Money Flow Index (MFI)
-            typical_price = (data['High'] + data['Low'] + data['Close']) / 3
-            money_flow = typical_price * data['Volume']
-            
-            positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0).rolling(window=14).sum()
-            negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0).rolling(window=14).sum()
-            
-            money_ratio = positive_flow / negative_flow
-            data['MFI'] = 100 - (100 / (1 + money_ratio))
+            data['MFI'] = indicators.mfi(typical_price, volume, 14)
             
         except Exception as e:
             logger.error(f"Error calculating volume indicators: {str(e)}")
         
         return data
     
-    def _calculate_momentum_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_momentum_indicators(self, data: pd.DataFrame, typical_price: np.ndarray) -> pd.DataFrame:
         """Calculate momentum indicators"""
         try:
             # Rate of Change (ROC)
@@ -247,10 +385,7 @@ class TechnicalAnalyzer:
             data['Momentum'] = data['Close'] - data['Close'].shift(10)
             
             # Commodity Channel Index (CCI)
-            typical_price = (data['High'] + data['Low'] + data['Close']) / 3
-            sma_tp = typical_price.rolling(window=20).mean()
-            mean_deviation = np.abs(typical_price - sma_tp).rolling(window=20).mean()
-            data['CCI'] = (typical_price - sma_tp) / (0.015 * mean_deviation)
+            data['CCI'] = indicators.cci(typical_price, 20)
             
         except Exception as e:
             logger.error(f"Error calculating momentum indicators: {str(e)}")
@@ -262,7 +397,7 @@ class TechnicalAnalyzer:
         try:
             # Average Directional Index (ADX)
             if TALIB_AVAILABLE:
-                data['ADX'] = talib.ADX(data['High'], data['Low'], data['Close'], timeperiod=14)
+                data['ADX'] = talib.ADX(*self._hlc(data), timeperiod=14)
             else:
                 # Simplified ADX calculation
                 data['ADX'] = data['Close'].rolling(window=14).std()
@@ -270,13 +405,10 @@ class TechnicalAnalyzer:
             # Parabolic SAR (simplified)
             data['SAR'] = data['Low'].rolling(window=5).min()
             
-            # Directional Indicators
-            data['DI_Plus'] = data['Close'].diff().rolling(window=14).apply(
-                lambda x: x[x > 0].sum() / len(x) if len(x) > 0 else 0
-            )
-            data['DI_Minus'] = data['Close'].diff().rolling(window=14).apply(
-                lambda x: abs(x[x < 0].sum()) / len(x) if len(x) > 0 else 0
-            )
+            # Directional Indicators: mean up-move and down-move over the window (other bars count as zero)
+            diff = data['Close'].diff()
+            data['DI_Plus'] = diff.clip(lower=0).rolling(window=14).mean()
+            data['DI_Minus'] = (-diff).clip(lower=0).rolling(window=14).mean()
             
         except Exception as e:
             logger.error(f"Error calculating trend indicators: {str(e)}")
@@ -311,88 +443,33 @@ class TechnicalAnalyzer:
     def _detect_candlestick_patterns(self, data: pd.DataFrame) -> List[Dict]:
         """Detect candlestick patterns using TA-Lib"""
         patterns = []
+        if not TALIB_AVAILABLE:
+            return patterns
         
         try:
-            # List of candlestick patterns to detect
-            pattern_functions = {
-                'CDL2CROWS': 'Two Crows',
-                'CDL3BLACKCROWS': 'Three Black Crows',
-                'CDL3INSIDE': 'Three Inside Up/Down',
-                'CDL3LINESTRIKE': 'Three-Line Strike',
-                'CDL3OUTSIDE': 'Three Outside Up/Down',
-                'CDL3STARSINSOUTH': 'Three Stars In The South',
-                'CDL3WHITESOLDIERS': 'Three White Soldiers',
-                'CDLABANDONEDBABY': 'Abandoned Baby',
-                'CDLADVANCEBLOCK': 'Advance Block',
-                'CDLBELTHOLD': 'Belt-hold',
-                'CDLBREAKAWAY': 'Breakaway',
-                'CDLDARKCLOUDCOVER': 'Dark Cloud Cover',
-                'CDLDOJI': 'Doji',
-                'CDLDOJISTAR': 'Doji Star',
-                'CDLDRAGONFLYDOJI': 'Dragonfly Doji',
-                'CDLENGULFING': 'Engulfing Pattern',
-                'CDLEVENINGDOJISTAR': 'Evening Doji Star',
-                'CDLEVENINGSTAR': 'Evening Star',
-                'CDLGAPSIDESIDEWHITE': 'Up/Down-gap side-by-side white lines',
-                'CDLGRAVESTONEDOJI': 'Gravestone Doji',
-                'CDLHAMMER': 'Hammer',
-                'CDLHANGINGMAN': 'Hanging Man',
-                'CDLHARAMI': 'Harami Pattern',
-                'CDLHARAMICROSS': 'Harami Cross Pattern',
-                'CDLHIGHWAVE': 'High-Wave Candle',
-                'CDLHIKKAKE': 'Hikkake Pattern',
-                'CDLHIKKAKEMOD': 'Modified Hikkake Pattern',
-                'CDLHOMINGPIGEON': 'Homing Pigeon',
-                'CDLIDENTICAL3CROWS': 'Identical Three Crows',
-                'CDLINNECK': 'In-Neck Pattern',
-                'CDLINVERTEDHAMMER': 'Inverted Hammer',
-                'CDLKICKING': 'Kicking',
-                'CDLKICKINGBYLENGTH': 'Kicking - bull/bear determined by the longer marubozu',
-                'CDLLADDERBOTTOM': 'Ladder Bottom',
-                'CDLLONGLEGGEDDOJI': 'Long Legged Doji',
-                'CDLLONGLINE': 'Long Line Candle',
-                'CDLMARUBOZU': 'Marubozu',
-                'CDLMATCHINGLOW': 'Matching Low',
-                'CDLMATHOLD': 'Mat Hold',
-                'CDLMORNINGDOJISTAR': 'Morning Doji Star',
-                'CDLMORNINGSTAR': 'Morning Star',
-                'CDLONNECK': 'On-Neck Pattern',
-                'CDLPIERCING': 'Piercing Pattern',
-                'CDLRICKSHAWMAN': 'Rickshaw Man',
-                'CDLRISEFALL3METHODS': 'Rising/Falling Three Methods',
-                'CDLSEPARATINGLINES': 'Separating Lines',
-                'CDLSHOOTINGSTAR': 'Shooting Star',
-                'CDLSHORTLINE': 'Short Line Candle',
-                'CDLSPINNINGTOP': 'Spinning Top',
-                'CDLSTALLEDPATTERN': 'Stalled Pattern',
-                'CDLSTICKSANDWICH': 'Stick Sandwich',
-                'CDLTAKURI': 'Takuri (Dragonfly Doji with very long lower shadow)',
-                'CDLTASUKIGAP': 'Tasuki Gap',
-                'CDLTHRUSTING': 'Thrusting Pattern',
-                'CDLTRISTAR': 'Tristar Pattern',
-                'CDLUNIQUE3RIVER': 'Unique 3 River',
-                'CDLUPSIDEGAP2CROWS': 'Upside Gap Two Crows',
-                'CDLXSIDEGAP3METHODS': 'Upside/Downside Gap Three Methods'
-            }
-            
-            for pattern_func, pattern_name in pattern_functions.items():
+            # Convert the price columns once; TA-Lib's functions work directly on float64 arrays
+            open_, high, low, close = (
+                data[col].to_numpy(dtype=np.float64) for col in ('Open', 'High', 'Low', 'Close')
+            )
+            dates = data['Date'].to_numpy(dtype=object) if 'Date' in data.columns else np.arange(len(data))
+            
+            for pattern_name, func in CANDLESTICK_FUNCTIONS:
                 try:
-                    if hasattr(talib, pattern_func):
-                        func = getattr(talib, pattern_func)
-                        result = func(data['Open'], data['High'], data['Low'], data['Close'])
-                        
-                        # Find where pattern occurs (non-zero values)
-                        pattern_occurrences = np.where(result != 0)[0]
-                        
-                        for idx in pattern_occurrences:
-                            if idx < len(data):
-                                patterns.append({
-                                    'pattern': pattern_name,
-                                    'date': data.iloc[idx]['Date'] if 'Date' in data.columns else idx,
-                                    'value': result[idx],
-                                    'strength': abs(result[idx]),
-                                    'type': 'bullish' if result[idx] > 0 else 'bearish'
-                                })
+                    result = func(open_, high, low, close)
+                    
+                    # Find where pattern occurs (non-zero values)
+                    occurrences = np.flatnonzero(result)
+                    values = result[occurrences]
+                    patterns.extend(
+                        {
+                            'pattern': pattern_name,
+                            'date': date,
+                            'value': value,
+                            'strength': strength,
+                            'type': 'bullish' if value > 0 else 'bearish'
+                        }
+                        for date, value, strength in zip(dates[occurrences], values, np.abs(values))
+                    )
                 except Exception as e:
                     logger.debug(f"Error detecting pattern {pattern_name}: {str(e)}")
                     continue
@@ -432,34 +509,46 @@ class TechnicalAnalyzer:
             if len(data) < 20:
                 return patterns
             
-            # Look for potential head and shoulders pattern
-            for i in range(10, len(data) - 10):
-                # Check for left shoulder
-                left_shoulder = data.iloc[i-5:i].max()
-                left_shoulder_idx = data.iloc[i-5:i]['High'].idxmax()
-                
-                # Check for head
-                head = data.iloc[i:i+5].max()
-                head_idx = data.iloc[i:i+5]['High'].idxmax()
-                
-                # Check for right shoulder
-                right_shoulder = data.iloc[i+5:i+10].max()
-                right_shoulder_idx = data.iloc[i+5:i+10]['High'].idxmax()
-                
-                # Check if head is higher than shoulders
-                if (head['High'] > left_shoulder['High'] and 
-                    head['High'] > right_shoulder['High'] and
-                    abs(left_shoulder['High'] - right_shoulder['High']) / left_shoulder['High'] < 0.1):
-                    
-                    patterns.append({
-                        'pattern': 'Head and Shoulders',
-                        'date': data.iloc[head_idx]['Date'] if 'Date' in data.columns else head_idx,
-                        'type': 'bearish',
-                        'strength': 0.8,
-                        'left_shoulder': left_shoulder['High'],
-                        'head': head['High'],
-                        'right_shoulder': right_shoulder['High']
-                    })
+            # Only the High column matters; reducing the whole frame fails on categorical columns.
+            # NaN highs become -inf so window maxima skip them, as Series.max() does
+            highs = data['High'].to_numpy(dtype=np.float64)
+            highs = np.where(np.isnan(highs), -np.inf, highs)
+            
+            # Max and first argmax of every 5-bar window; window j covers highs[j:j+5]
+            windows = np.lib.stride_tricks.sliding_window_view(highs, 5)
+            window_max = windows.max(axis=1)
+            window_argmax = windows.argmax(axis=1)
+            
+            # Shoulders are the windows just before and after the head window at i
+            positions = np.arange(10, len(data) - 10)
+            left_shoulder = window_max[positions - 5]
+            head = window_max[positions]
+            right_shoulder = window_max[positions + 5]
+            
+            # Check if head is higher than shoulders
+            with np.errstate(divide='ignore', invalid='ignore'):
+                mask = ((head > left_shoulder) &
+                        (head > right_shoulder) &
+                        (np.abs(left_shoulder - right_shoulder) / left_shoulder < 0.1))
+            
+            hits = np.flatnonzero(mask)
+            head_idx = positions[hits] + window_argmax[positions[hits]]
+            dates = data['Date'].to_numpy(dtype=object)[head_idx] if 'Date' in data.columns else data.index[head_idx]
+            
+            patterns = [
+                {
+                    'pattern': 'Head and Shoulders',
+                    'date': date,
+                    'type': 'bearish',
+                    'strength': 0.8,
+                    'left_shoulder': left,
+                    'head': top,
+                    'right_shoulder': right
+                }
+                for date, left, top, right in zip(
+                    dates, left_shoulder[hits].tolist(), head[hits].tolist(), right_shoulder[hits].tolist()
+                )
+            ]
             
         except Exception as e:
             logger.error(f"Error detecting head and shoulders: {str(e)}")
@@ -478,13 +567,12 @@ class TechnicalAnalyzer:
             recent_data = data.tail(20)
             
             # Calculate trend lines
-            highs = recent_data['High'].values
-            lows = recent_data['Low'].values
-            dates = range(len(recent_data))
+            highs = recent_data['High'].to_numpy(dtype=np.float64)
+            lows = recent_data['Low'].to_numpy(dtype=np.float64)
             
-            # Fit lines to highs and lows
-            high_slope, high_intercept = np.polyfit(dates, highs, 1)
-            low_slope, low_intercept = np.polyfit(dates, lows, 1)
+            # Fit lines to highs and lows; only the slopes are needed
+            high_slope = TREND_OFFSETS @ (highs - highs.mean()) / TREND_SUM_SQUARES
+            low_slope = TREND_OFFSETS @ (lows - lows.mean()) / TREND_SUM_SQUARES
             
             # Check for triangle patterns
             if abs(high_slope) < 0.1 and abs(low_slope) < 0.1:
@@ -534,40 +622,34 @@ class TechnicalAnalyzer:
             highs = recent_data['High'].values
             lows = recent_data['Low'].values
             
-            # Simple peak detection
-            peaks = []
-            troughs = []
-            
-            for i in range(1, len(highs) - 1):
-                if highs[i] > highs[i-1] and highs[i] > highs[i+1]:
-                    peaks.append((i, highs[i]))
-                if lows[i] < lows[i-1] and lows[i] < lows[i+1]:
-                    troughs.append((i, lows[i]))
+            # Simple peak detection: bars strictly above (below) both neighbours
+            peaks = highs[1:-1][(highs[1:-1] > highs[:-2]) & (highs[1:-1] > highs[2:])]
+            troughs = lows[1:-1][(lows[1:-1] < lows[:-2]) & (lows[1:-1] < lows[2:])]
             
             # Check for double top
             if len(peaks) >= 2:
                 peak1, peak2 = peaks[-2], peaks[-1]
-                if abs(peak1[1] - peak2[1]) / peak1[1] < 0.05:  # Within 5%
+                if abs(peak1 - peak2) / peak1 < 0.05:  # Within 5%
                     patterns.append({
                         'pattern': 'Double Top',
                         'date': data.iloc[-1]['Date'] if 'Date' in data.columns else len(data) - 1,
                         'type': 'bearish',
                         'strength': 0.7,
-                        'peak1': peak1[1],
-                        'peak2': peak2[1]
+                        'peak1': float(peak1),
+                        'peak2': float(peak2)
                     })
             
             # Check for double bottom
             if len(troughs) >= 2:
                 trough1, trough2 = troughs[-2], troughs[-1]
-                if abs(trough1[1] - trough2[1]) / trough1[1] < 0.05:  # Within 5%
+                if abs(trough1 - trough2) / trough1 < 0.05:  # Within 5%
                     patterns.append({
                         'pattern': 'Double Bottom',
                         'date': data.iloc[-1]['Date'] if 'Date' in data.columns else len(data) - 1,
                         'type': 'bullish',
                         'strength': 0.7,
-                        'trough1': trough1[1],
-                        'trough2': trough2[1]
+                        'trough1': float(trough1),
+                        'trough2': float(trough2)
                     })
             
         except Exception as e:
@@ -588,21 +670,18 @@ class TechnicalAnalyzer:
             highs = recent_data['High'].values
             lows = recent_data['Low'].values
             
-            # Find significant levels using clustering
-            from sklearn.cluster import DBSCAN
-            
-            # Combine highs and lows for clustering
+            # Combine highs and lows for clustering; missing prices can't belong to a level
             all_levels = np.concatenate([highs, lows])
-            all_levels = all_levels.reshape(-1, 1)
+            all_levels = all_levels[~np.isnan(all_levels)]
             
             # Cluster levels that are close to each other
-            clustering = DBSCAN(eps=0.02, min_samples=3).fit(all_levels)
+            labels = self._cluster_levels(all_levels, eps=0.02, min_samples=3)
             
             # Get cluster centers
-            unique_labels = np.unique(clustering.labels_)
+            unique_labels = np.unique(labels)
             for label in unique_labels:
                 if label != -1:  # Skip noise points
-                    cluster_points = all_levels[clustering.labels_ == label]
+                    cluster_points = all_levels[labels == label]
                     center = np.mean(cluster_points)
                     
                     # Determine if it's support or resistance
@@ -614,7 +693,7 @@ class TechnicalAnalyzer:
                         'date': data.iloc[-1]['Date'] if 'Date' in data.columns else len(data) - 1,
                         'type': 'neutral',
                         'strength': 0.8,
-                        'level': center,
+                        'level': float(center),
                         'level_type': level_type,
                         'cluster_size': len(cluster_points)
                     })
@@ -624,6 +703,61 @@ class TechnicalAnalyzer:
         
         return levels
     
+    def _neighbour_counts(self, ordered: np.ndarray, eps: float) -> np.ndarray:
+        """Count values within eps of each sorted value (inclusive, counting itself)"""
+        n = len(ordered)
+        hi = np.searchsorted(ordered, ordered + eps, side='right')
+        lo = np.searchsorted(ordered, ordered - eps, side='left')
+        
+        # ordered +/- eps rounds, so nudge the bounds until they agree with the distance test itself
+        while True:
+            shrink_hi = ordered[hi - 1] - ordered > eps
+            grow_hi = (hi < n) & (ordered[np.minimum(hi, n - 1)] - ordered <= eps)
+            shrink_lo = ordered - ordered[lo] > eps
+            grow_lo = (lo > 0) & (ordered - ordered[np.maximum(lo - 1, 0)] <= eps)
+            if not (shrink_hi.any() or grow_hi.any() or shrink_lo.any() or grow_lo.any()):
+                return hi - lo
+            hi = hi - shrink_hi + grow_hi
+            lo = lo + shrink_lo - grow_lo
+    
+    def _cluster_levels(self, values: np.ndarray, eps: float, min_samples: int) -> np.ndarray:
+        """Label 1-D values as DBSCAN(eps, min_samples) would; -1 marks noise"""
+        labels = np.full(len(values), -1)
+        
+        # On sorted values every eps-neighbourhood is a contiguous run
+        order = np.argsort(values, kind='stable')
+        ordered = values[order].astype(np.float64)
+        neighbours = self._neighbour_counts(ordered, eps)
+        core = np.flatnonzero(neighbours >= min_samples)
+        if len(core) == 0:
+            return labels
+        
+        # Core points chain into one cluster until the gap to the next core point exceeds eps
+        group = np.concatenate([[0], np.cumsum(np.diff(ordered[core]) > eps)])
+        
+        # DBSCAN numbers clusters in the order their first core point appears in the input
+        first_seen = np.full(group[-1] + 1, len(values))
+        np.minimum.at(first_seen, group, order[core])
+        group_label = np.argsort(np.argsort(first_seen))
+        
+        sorted_labels = np.full(len(values), -1)
+        sorted_labels[core] = group_label[group]
+        
+        # Border points join the cluster of a core point within eps, the earlier-numbered one if both sides qualify
+        border = np.flatnonzero(neighbours < min_samples)
+        after = np.searchsorted(core, border)
+        left_core = core[np.maximum(after - 1, 0)]
+        right_core = core[np.minimum(after, len(core) - 1)]
+        left_label = np.where((after > 0) & (ordered[border] - ordered[left_core] <= eps),
+                              sorted_labels[left_core], len(values))
+        right_label = np.where((after < len(core)) & (ordered[right_core] - ordered[border] <= eps),
+                               sorted_labels[right_core], len(values))
+        border_label = np.minimum(left_label, right_label)
+        sorted_labels[border] = np.where(border_label < len(values), border_label, -1)
+        
+        labels[order] = sorted_labels
+        return labels
+    
     def generate_signals(self, data: pd.DataFrame) -> Dict[str, Dict]:
         """Generate buy/sell signals based on technical indicators"""
         if data.empty:
@@ -632,25 +766,29 @@ class TechnicalAnalyzer:
         signals = {}
         
         try:
+            prev, last = self._latest_rows(data)
+            
             # RSI signals
             if 'RSI' in data.columns:
-                signals['RSI'] = self._generate_rsi_signals(data)
+                signals['RSI'] = self._generate_rsi_signals(last)
             
             # MACD signals
             if 'MACD' in data.columns and 'MACD_Signal' in data.columns:
-                signals['MACD'] = self._generate_macd_signals(data)
+                signals['MACD'] = self._generate_macd_signals(last, prev)
             
             # Bollinger Bands signals
             if 'BB_Upper' in data.columns and 'BB_Lower' in data.columns:
-                signals['Bollinger_Bands'] = self._generate_bollinger_signals(data)
+                signals['Bollinger_Bands'] = self._generate_bollinger_signals(last)
             
             # Moving Average signals
             if 'SMA_20' in data.columns and 'SMA_50' in data.columns:
-                signals['Moving_Averages'] = self._generate_ma_signals(data)
+                signals['Moving_Averages'] = self._generate_ma_signals(last, prev)
             
             # Volume signals
             if 'OBV' in data.columns and 'Volume' in data.columns:
-                signals['Volume'] = self._generate_volume_signals(data)
+                # Average of the last 20 volumes, skipping gaps like Series.mean()
+                avg_volume = np.nanmean(data['Volume'].to_numpy()[-20:])
+                signals['Volume'] = self._generate_volume_signals(last, prev, avg_volume)
             
             # Combined signal
             signals['Combined'] = self._generate_combined_signal(signals)
@@ -660,11 +798,21 @@ class TechnicalAnalyzer:
         
         return signals
     
-    def _generate_rsi_signals(self, data: pd.DataFrame) -> Dict:
+    def _latest_rows(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Previous and latest values of SIGNAL_COLUMNS as float64 rows; absent columns and bars read as NaN"""
+        # Column by column, so only the two tail values of each column are copied
+        rows = np.full((2, len(SIGNAL_COLUMNS)), np.nan)
+        for position, col in enumerate(SIGNAL_COLUMNS):
+            if col in data.columns:
+                values = data[col].to_numpy()[-2:]
+                rows[2 - len(values):, position] = values
+        return rows[0], rows[1]
+    
+    def _generate_rsi_signals(self, last: np.ndarray) -> Dict:
         """Generate RSI-based signals"""
-        latest_rsi = data['RSI'].iloc[-1]
+        latest_rsi = last[COL_RSI]
         
-        if pd.isna(latest_rsi):
+        if math.isnan(latest_rsi):
             return {'signal': 'neutral', 'strength': 0, 'reason': 'Insufficient data'}
         
         if latest_rsi > 70:
@@ -687,21 +835,21 @@ class TechnicalAnalyzer:
             'value': latest_rsi
         }
     
-    def _generate_macd_signals(self, data: pd.DataFrame) -> Dict:
+    def _generate_macd_signals(self, last: np.ndarray, prev: np.ndarray) -> Dict:
         """Generate MACD-based signals"""
-        latest_macd = data['MACD'].iloc[-1]
-        latest_signal = data['MACD_Signal'].iloc[-1]
-        latest_hist = data['MACD_Histogram'].iloc[-1]
+        latest_macd = last[COL_MACD]
+        latest_signal = last[COL_MACD_SIGNAL]
+        latest_hist = last[COL_MACD_HISTOGRAM]
         
-        if pd.isna(latest_macd) or pd.isna(latest_signal):
+        if math.isnan(latest_macd) or math.isnan(latest_signal):
             return {'signal': 'neutral', 'strength': 0, 'reason': 'Insufficient data'}
         
         # MACD crossover signals
-        if latest_macd > latest_signal and data['MACD'].iloc[-2] <= data['MACD_Signal'].iloc[-2]:
+        if latest_macd > latest_signal and prev[COL_MACD] <= prev[COL_MACD_SIGNAL]:
             signal = 'buy'
             strength = min(abs(latest_hist) / 2, 1.0)
             reason = 'MACD bullish crossover'
-        elif latest_macd < latest_signal and data['MACD'].iloc[-2] >= data['MACD_Signal'].iloc[-2]:
+        elif latest_macd < latest_signal and prev[COL_MACD] >= prev[COL_MACD_SIGNAL]:
             signal = 'sell'
             strength = min(abs(latest_hist) / 2, 1.0)
             reason = 'MACD bearish crossover'
@@ -719,14 +867,14 @@ class TechnicalAnalyzer:
             'histogram': latest_hist
         }
     
-    def _generate_bollinger_signals(self, data: pd.DataFrame) -> Dict:
+    def _generate_bollinger_signals(self, last: np.ndarray) -> Dict:
         """Generate Bollinger Bands-based signals"""
-        latest_close = data['Close'].iloc[-1]
-        latest_upper = data['BB_Upper'].iloc[-1]
-        latest_lower = data['BB_Lower'].iloc[-1]
-        latest_position = data['BB_Position'].iloc[-1]
+        latest_close = last[COL_CLOSE]
+        latest_upper = last[COL_BB_UPPER]
+        latest_lower = last[COL_BB_LOWER]
+        latest_position = last[COL_BB_POSITION]
         
-        if pd.isna(latest_close) or pd.isna(latest_upper) or pd.isna(latest_lower):
+        if math.isnan(latest_close) or math.isnan(latest_upper) or math.isnan(latest_lower):
             return {'signal': 'neutral', 'strength': 0, 'reason': 'Insufficient data'}
         
         if latest_close <= latest_lower:
@@ -751,22 +899,22 @@ class TechnicalAnalyzer:
             'lower_band': latest_lower
         }
     
-    def _generate_ma_signals(self, data: pd.DataFrame) -> Dict:
+    def _generate_ma_signals(self, last: np.ndarray, prev: np.ndarray) -> Dict:
         """Generate Moving Average-based signals"""
-        latest_close = data['Close'].iloc[-1]
-        latest_sma20 = data['SMA_20'].iloc[-1]
-        latest_sma50 = data['SMA_50'].iloc[-1]
-        latest_sma200 = data['SMA_200'].iloc[-1]
+        latest_close = last[COL_CLOSE]
+        latest_sma20 = last[COL_SMA_20]
+        latest_sma50 = last[COL_SMA_50]
+        latest_sma200 = last[COL_SMA_200]
         
-        if pd.isna(latest_sma20) or pd.isna(latest_sma50):
+        if math.isnan(latest_sma20) or math.isnan(latest_sma50):
             return {'signal': 'neutral', 'strength': 0, 'reason': 'Insufficient data'}
         
         # Golden Cross / Death Cross
-        if latest_sma20 > latest_sma50 and data['SMA_20'].iloc[-2] <= data['SMA_50'].iloc[-2]:
+        if latest_sma20 > latest_sma50 and prev[COL_SMA_20] <= prev[COL_SMA_50]:
             signal = 'buy'
             strength = 0.8
             reason = 'Golden Cross (20 SMA crosses above 50 SMA)'
-        elif latest_sma20 < latest_sma50 and data['SMA_20'].iloc[-2] >= data['SMA_50'].iloc[-2]:
+        elif latest_sma20 < latest_sma50 and prev[COL_SMA_20] >= prev[COL_SMA_50]:
             signal = 'sell'
             strength = 0.8
             reason = 'Death Cross (20 SMA crosses below 50 SMA)'
@@ -788,23 +936,20 @@ class TechnicalAnalyzer:
             'sma200': latest_sma200
         }
     
-    def _generate_volume_signals(self, data: pd.DataFrame) -> Dict:
+    def _generate_volume_signals(self, last: np.ndarray, prev: np.ndarray, avg_volume: float) -> Dict:
         """Generate Volume-based signals"""
-        latest_volume = data['Volume'].iloc[-1]
-        latest_close = data['Close'].iloc[-1]
-        latest_obv = data['OBV'].iloc[-1]
+        latest_volume = last[COL_VOLUME]
+        latest_close = last[COL_CLOSE]
+        latest_obv = last[COL_OBV]
         
-        if pd.isna(latest_volume) or pd.isna(latest_obv):
+        if math.isnan(latest_volume) or math.isnan(latest_obv):
             return {'signal': 'neutral', 'strength': 0, 'reason': 'Insufficient data'}
         
-        # Calculate average volume
-        avg_volume = data['Volume'].tail(20).mean()
-        
-        # Volume spike
+        # Volume spike relative to the 20-bar average volume
         volume_ratio = latest_volume / avg_volume
         
         if volume_ratio > 2.0:  # Volume spike
-            if latest_close > data['Close'].iloc[-2]:  # Price up
+            if latest_close > prev[COL_CLOSE]:  # Price up
                 signal = 'buy'
                 strength = min(volume_ratio / 5, 1.0)
                 reason = f'High volume price increase (volume ratio: {volume_ratio:.2f})'
@@ -830,35 +975,18 @@ class TechnicalAnalyzer:
         if not individual_signals:
             return {'signal': 'neutral', 'strength': 0, 'reason': 'No signals available'}
         
-        # Weight the signals
-        signal_weights = {
-            'RSI': 0.2,
-            'MACD': 0.25,
-            'Bollinger_Bands': 0.2,
-            'Moving_Averages': 0.25,
-            'Volume': 0.1
-        }
-        
         total_weight = 0
         weighted_score = 0
         
         for signal_name, signal_data in individual_signals.items():
-            if signal_name == 'Combined':
+            # Unweighted entries (e.g. a previous 'Combined') and malformed ones are skipped
+            weight = SIGNAL_WEIGHTS.get(signal_name)
+            if weight is None or 'signal' not in signal_data:
                 continue
-                
-            if signal_name in signal_weights and 'signal' in signal_data:
-                weight = signal_weights[signal_name]
-                total_weight += weight
-                
-                # Convert signal to numeric score
-                if signal_data['signal'] == 'buy':
-                    score = signal_data.get('strength', 0.5)
-                elif signal_data['signal'] == 'sell':
-                    score = -signal_data.get('strength', 0.5)
-                else:
-                    score = 0
-                
-                weighted_score += score * weight
+            
+            # Buy scores +strength, sell -strength, anything else zero
+            total_weight += weight
+            weighted_score += SIGNAL_DIRECTIONS.get(signal_data['signal'], 0) * signal_data.get('strength', 0.5) * weight
         
         if total_weight == 0:
             return {'signal': 'neutral', 'strength': 0, 'reason': 'No weighted signals available'}
@@ -885,6 +1013,7 @@ class TechnicalAnalyzer:
             'strength': strength,
             'reason': reason,
             'score': normalized_score,
-            'individual_signals': individual_signals
+            # Snapshot, so the caller storing this under 'Combined' doesn't make the dict contain itself
+            'individual_signals': dict(individual_signals)
         }
 
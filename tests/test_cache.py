@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import cache
+
+def _statement():
+    """A fetch result shaped like get_balance_sheet's: a split frame with date columns and gaps"""
+    frame = pd.DataFrame(
+        [[1.5e9, np.nan], [2.0e8, 1.9e8]],
+        index=['Total Assets', 'Total Debt'],
+        columns=pd.to_datetime(['2023-12-31', '2022-12-31'])
+    )
+    return {
+        'symbol': 'AAPL',
+        'balance_sheet': frame.to_dict('split'),
+        'last_updated': datetime(2024, 1, 2, 3, 4, 5, 678901)
+    }
+
+def test_disk_hit_matches_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, 'file_cache', cache.FileCache(str(tmp_path)))
+    calls = []
+    
+    def fetch(self, symbol):
+        calls.append(symbol)
+        return _statement()
+    
+    # Separate decorators have separate memory caches, so the second call is served from disk
+    miss = cache.cached('balance_sheet', ttl=60)(fetch)(None, 'AAPL')
+    hit = cache.cached('balance_sheet', ttl=60)(fetch)(None, 'AAPL')
+    
+    assert calls == ['AAPL']
+    # repr compares the types too (Timestamp vs str, datetime vs str) and treats NaN as equal
+    assert repr(hit) == repr(miss)
+    assert isinstance(hit['last_updated'], datetime)
+    assert isinstance(hit['balance_sheet']['columns'][0], pd.Timestamp)
+
+def test_list_argument(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, 'file_cache', cache.FileCache(str(tmp_path)))
+    calls = []
+    
+    @cache.cached('fundamental', ttl=60)
+    def fetch(self, symbol, fields=None):
+        calls.append(fields)
+        return {'symbol': symbol, **{field: 1.0 for field in fields}}
+    
+    first = fetch(None, 'AAPL', fields=['pe_ratio', 'beta'])
+    second = fetch(None, 'AAPL', fields=['pe_ratio', 'beta'])
+    
+    assert calls == [['pe_ratio', 'beta']]
+    assert first == second == {'symbol': 'AAPL', 'pe_ratio': 1.0, 'beta': 1.0}
@@ -0,0 +1,40 @@
+import orjson
+
+from data_fetcher import StockDataFetcher
+
+# Three daily bars; a dividend is paid on the second and a 4:1 split lands on the third
+CHART = {'chart': {'result': [{
+    'meta': {'exchangeTimezoneName': 'America/New_York'},
+    'timestamp': [1700058600, 1700145000, 1700231400],
+    'events': {
+        'dividends': {'1700145000': {'amount': 0.24, 'date': 1700145000}},
+        'splits': {'1700231400': {'date': 1700231400, 'numerator': 4, 'denominator': 1, 'splitRatio': '4:1'}}
+    },
+    'indicators': {
+        'quote': [{
+            'open': [10.0, 11.0, 12.0],
+            'high': [10.5, 11.5, 12.5],
+            'low': [9.5, 10.5, 11.5],
+            'close': [10.2, 11.2, 12.2],
+            'volume': [100, 200, 300]
+        }],
+        'adjclose': [{'adjclose': [10.2, 11.2, 12.2]}]
+    }
+}]}}
+
+class _Response:
+    content = orjson.dumps(CHART)
+    
+    def raise_for_status(self):
+        pass
+
+def test_chart_has_history_columns(monkeypatch):
+    fetcher = StockDataFetcher()
+    monkeypatch.setattr(fetcher.session, 'get', lambda *args, **kwargs: _Response())
+    
+    data = fetcher._chart('AAPL', '5d', '1d')
+    
+    # Same columns as ticker.history, so the frame doesn't depend on which path answered
+    assert list(data.columns) == ['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits']
+    assert data['Dividends'].tolist() == [0.0, 0.24, 0.0]
+    assert data['Stock Splits'].tolist() == [0.0, 0.0, 4.0]
@@ -0,0 +1,18 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _import_with_default_config(module: str) -> subprocess.CompletedProcess:
+    """Import a module in a fresh interpreter with no DATABASE_URL override"""
+    env = {k: v for k, v in os.environ.items() if k != 'DATABASE_URL'}
+    return subprocess.run([sys.executable, '-c', f'import {module}'], cwd=ROOT, env=env, capture_output=True, text=True)
+
+def test_database_imports_with_default_config():
+    result = _import_with_default_config('database')
+    assert result.returncode == 0, result.stderr
+
+def test_main_imports_with_default_config():
+    result = _import_with_default_config('main')
+    assert result.returncode == 0, result.stderr